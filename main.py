@@ -17,7 +17,6 @@ Usage:
 """
 
 import sys
-import asyncio
 import logging
 from pathlib import Path
 
@@ -57,7 +56,7 @@ def setup_project_logging() -> None:
 
 @time_function
 @log_function
-async def main() -> None:
+def main() -> None:
     """Main application entry point with comprehensive logging and monitoring."""
     bot_logger = get_bot_logger()
     logger = bot_logger.get_logger(__name__)
@@ -84,9 +83,10 @@ async def main() -> None:
         bot_logger.performance.end_timer("bot_startup")
         logger.info("🎯 Bot initialization completed, starting main loop...")
         
-        # Start the bot with performance monitoring
+        # Run the bot until a stop signal, with performance monitoring
         bot_logger.performance.start_timer("bot_runtime")
-        await bot.start_bot()
+        bot.run_bot()
+        bot_logger.performance.end_timer("bot_runtime")
         
     except KeyboardInterrupt:
         logger.info("🛑 Bot stopped by user (Ctrl+C)")
@@ -111,15 +111,15 @@ def run_bot() -> None:
     """
     Synchronous entry point for running the bot.
     
-    Sets up logging and runs the async main function with proper
+    Sets up logging and runs the main function with proper
     error handling and performance monitoring.
     """
     try:
         # Setup enhanced logging first
         setup_project_logging()
         
-        # Run the async bot
-        asyncio.run(main())
+        # Run the bot (LinkedInJobBot.run_bot owns the event loop)
+        main()
         
     except KeyboardInterrupt:
         logger = get_bot_logger().get_logger(__name__)
@@ -5,51 +5,187 @@ Professional conversation management for the LinkedIn Job & Internship Bot.
 Handles user interactions, state management, and conversation flow with real-time streaming.
 """
 
+import asyncio
 import logging
+import re
 import time
-from typing import Dict, Any, Optional, Tuple, List
-from enum import Enum, auto
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional, Tuple, List
+from enum import IntEnum
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes, ConversationHandler
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, Message
+from telegram.error import BadRequest
+from telegram.ext import (
+    CallbackQueryHandler,
+    CommandHandler,
+    ContextTypes,
+    ConversationHandler,
+    MessageHandler,
+    filters,
+)
 
 from ..utils.config import ConfigurationManager
-from .messages import MessageTemplates, JobType
+from .messages import MessageTemplates, MessageFormatter, JobType, escape_markdown
 
 
-class ConversationState(Enum):
-    """Conversation state enumeration."""
-    SELECTING_JOB_TYPE = auto()
-    ENTERING_ROLE = auto()
-    SEARCHING = auto()
+# Seconds of inactivity before a conversation (and its stored state) expires
+CONVERSATION_TIMEOUT = 300
+
+# Job type selected by each inline keyboard button
+_JOB_TYPE_MAP = {
+    "job_full_time": JobType.JOB,
+    "job_internship": JobType.INTERNSHIP,
+}
+
+# Job type selection keyboard sent with every /start
+_JOB_TYPE_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Full-time Job", callback_data="job_full_time")],
+    [InlineKeyboardButton("Internship", callback_data="job_internship")]
+])
+
+# Fixed replies, rendered once
+_ERROR_MSG = MessageTemplates.error_message()
+_INVALID_STATE_MSG = MessageTemplates.invalid_state_message()
+
+# Search outcome replies, filled in with str.format at send time
+_SEARCH_COMPLETE_TEMPLATE = (
+    "✅ **Search Complete!**\n\n"
+    "📊 **Total Found**: {total_found} {role} opportunities\n"
+    "🔍 **Search Strategy**: India → Remote → Global\n\n"
+    "💼 **Good luck with your applications!**\n"
+    "🔄 **Use /start to search for different roles**"
+)
+_NO_RESULTS_TEMPLATE = (
+    "**No {role} positions found**\n\n"
+    "**Comprehensive search completed:**\n"
+    "✓ India locations (Bangalore, Mumbai, Delhi, etc.)\n"
+    "✓ Remote positions suitable for India\n"
+    "✓ Global opportunities\n\n"
+    "**Suggestions to improve results:**\n"
+    "• Try different keywords:\n"
+    "  - 'Software Developer' instead of '{role}'\n"
+    "  - 'Backend Developer' or 'Frontend Developer'\n"
+    "  - 'Full Stack Developer' for broader results\n"
+    "• Try broader terms like 'Software Engineer'\n"
+    "• Check back in a few hours - new jobs are posted regularly\n\n"
+    "**Try again with different keywords using /start**"
+)
+_SEARCH_ERROR_TEMPLATE = (
+    "**Search Error**\n\n"
+    "**There was an issue while searching for {role}**\n\n"
+    "**Please try again with /start**\n"
+    "If the problem persists, the service might be temporarily unavailable."
+)
+_TIMEOUT_MSG = (
+    "**Conversation timed out**\n\n"
+    "Please use /start to begin a new search."
+)
+_FALLBACK_MSG = "I didn't understand that. Please use /start to begin a new search."
+
+# Accepted role text: 3-64 word characters, spaces and common title punctuation
+# (C++, C#, Node.js, R&D, Full-Stack, (Remote), Women's Health, ...); links,
+# markup and other symbols are rejected
+_ROLE_RE = re.compile(r"[\w\s+.#/&(),'’-]{3,64}")
+
+# Raw messages longer than this are rejected without being stripped
+_MAX_ROLE_INPUT = 128
+
+# Streamed jobs arriving within this many seconds of each other share one message
+JOB_BATCH_WINDOW = 0.75
+
+# Upper bound on jobs per message (keeps batches well under Telegram's 4096 chars)
+JOB_BATCH_SIZE = 5
+
+# Scraper class, imported on the first search rather than at bot startup
+_SCRAPER_CLS = None
+
+
+def _scraper_cls():
+    """Get the LinkedInScraper class, importing the scraper package once."""
+    global _SCRAPER_CLS
+    if _SCRAPER_CLS is None:
+        from ..scraper.linkedin import LinkedInScraper
+        _SCRAPER_CLS = LinkedInScraper
+    return _SCRAPER_CLS
+
+
+class ConversationState(IntEnum):
+    """Conversation state enumeration (members are the ints PTB stores)."""
+    SELECTING_JOB_TYPE = 1
+    ENTERING_ROLE = 2
+    SEARCHING = 3
 
 
 class ConversationData:
-    """Manages conversation data for users."""
+    """
+    Manages conversation data for users.
+    
+    Each field is kept in its own flat dict keyed by user id, so a user
+    costs one entry per field instead of a separate object per user.
+    job_type and role have dedicated dicts; any other key gets its
+    field dict on first write.
+    """
+    
+    # Writes between sweeps for expired conversations
+    SWEEP_INTERVAL = 128
     
     def __init__(self):
-        self._user_data: Dict[int, Dict[str, Any]] = {}
+        self._job_type: Dict[int, JobType] = {}
+        self._role: Dict[int, str] = {}
+        self._updated: Dict[int, float] = {}
+        self._fields: Dict[str, Dict[int, Any]] = {"job_type": self._job_type, "role": self._role}
+        self._writes = 0
     
     def get_user_data(self, user_id: int) -> Dict[str, Any]:
-        """Get user data, creating if not exists."""
-        if user_id not in self._user_data:
-            self._user_data[user_id] = {}
-        return self._user_data[user_id]
+        """Get a snapshot of the stored fields for a user."""
+        return {key: values[user_id] for key, values in self._fields.items() if user_id in values}
     
     def set_user_data(self, user_id: int, key: str, value: Any) -> None:
         """Set user data."""
-        user_data = self.get_user_data(user_id)
-        user_data[key] = value
+        values = self._fields.get(key)
+        if values is None:
+            values = self._fields[key] = {}
+        values[user_id] = value
+        self._updated[user_id] = time.monotonic()
+        
+        # Lazily sweep abandoned conversations every SWEEP_INTERVAL writes
+        self._writes += 1
+        if self._writes >= self.SWEEP_INTERVAL:
+            self._writes = 0
+            self.evict_expired()
     
     def get_user_value(self, user_id: int, key: str, default: Any = None) -> Any:
-        """Get specific user value."""
-        user_data = self.get_user_data(user_id)
-        return user_data.get(key, default)
+        """Get specific user value (reads never create an entry)."""
+        values = self._fields.get(key)
+        if values is None:
+            return default
+        return values.get(user_id, default)
+    
+    def get_conversation_data(self, user_id: int) -> Tuple[Optional[JobType], Optional[str]]:
+        """Get (job_type, role) for a user without creating an entry."""
+        return self._job_type.get(user_id), self._role.get(user_id)
     
     def clear_user_data(self, user_id: int) -> None:
         """Clear user data."""
-        if user_id in self._user_data:
-            del self._user_data[user_id]
+        for values in self._fields.values():
+            values.pop(user_id, None)
+        self._updated.pop(user_id, None)
+    
+    def evict_expired(self, max_age: float = CONVERSATION_TIMEOUT) -> int:
+        """
+        Drop state for conversations idle for more than max_age seconds.
+        
+        Conversations that time out or are abandoned never reach
+        clear_user_data(), so their entries would otherwise stay forever.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        cutoff = time.monotonic() - max_age
+        expired = [uid for uid, updated_at in self._updated.items() if updated_at < cutoff]
+        for uid in expired:
+            self.clear_user_data(uid)
+        return len(expired)
 
 
 class ConversationHandlers:
@@ -60,6 +196,50 @@ class ConversationHandlers:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.conversation_data = ConversationData()
+        
+        # Built once by create_conversation_handler()
+        self._conversation_handler: Optional[ConversationHandler] = None
+        
+        # Scraper shared by all searches, created on first use
+        self._scraper = None
+        self._scraper_lock = asyncio.Lock()
+        
+        # Per-user locks so one user's searches run in order without blocking others,
+        # with the number of searches holding or waiting on each
+        self._user_locks: Dict[int, asyncio.Lock] = {}
+        self._user_lock_users: Dict[int, int] = {}
+
+    @asynccontextmanager
+    async def _user_search_lock(self, user_id: int) -> AsyncIterator[None]:
+        """Hold a user's search lock, dropping it once no search holds or waits on it."""
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        self._user_lock_users[user_id] = self._user_lock_users.get(user_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            remaining = self._user_lock_users[user_id] - 1
+            if remaining:
+                self._user_lock_users[user_id] = remaining
+            else:
+                del self._user_lock_users[user_id]
+                del self._user_locks[user_id]
+
+    async def _get_scraper(self):
+        """Get the shared LinkedInScraper, creating it on first use."""
+        if self._scraper is None:
+            async with self._scraper_lock:
+                if self._scraper is None:
+                    self._scraper = _scraper_cls()(self.config)
+        return self._scraper
+
+    async def aclose(self) -> None:
+        """Release the shared scraper and its browser."""
+        if self._scraper is not None:
+            await self._scraper.aclose()
+            self._scraper = None
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle /start command."""
@@ -70,28 +250,21 @@ class ConversationHandlers:
             # Clear any existing conversation data
             self.conversation_data.clear_user_data(user_id)
             
-            # Create job type selection keyboard
-            keyboard = [
-                [InlineKeyboardButton("Full-time Job", callback_data="job_full_time")],
-                [InlineKeyboardButton("Internship", callback_data="job_internship")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
             welcome_msg = MessageTemplates.welcome_message(user.first_name or "there")
             
             await update.message.reply_text(
                 welcome_msg,
-                reply_markup=reply_markup,
+                reply_markup=_JOB_TYPE_KEYBOARD,
                 parse_mode='Markdown'
             )
             
-            self.logger.info(f"Started conversation with user {user_id} ({user.username or 'no username'})")
+            self.logger.info("Started conversation with user %s (%s)", user_id, user.username or 'no username')
             
-            return ConversationState.SELECTING_JOB_TYPE.value
+            return ConversationState.SELECTING_JOB_TYPE
             
         except Exception as e:
-            self.logger.error(f"Error in start_command: {e}")
-            await update.message.reply_text(MessageTemplates.error_message())
+            self.logger.error("Error in start_command: %s", e)
+            await update.message.reply_text(_ERROR_MSG)
             return ConversationHandler.END
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -104,11 +277,11 @@ class ConversationHandlers:
             
             await update.message.reply_text(help_msg, parse_mode='Markdown')
             
-            self.logger.info(f"Sent help message to user {update.effective_user.id}")
+            self.logger.info("Sent help message to user %s", update.effective_user.id)
             
         except Exception as e:
-            self.logger.error(f"Error in help_command: {e}")
-            await update.message.reply_text(MessageTemplates.error_message())
+            self.logger.error("Error in help_command: %s", e)
+            await update.message.reply_text(_ERROR_MSG)
 
     async def job_type_selection(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle job type selection."""
@@ -119,11 +292,8 @@ class ConversationHandlers:
             user_id = update.effective_user.id
             
             # Parse job type
-            if query.data == "job_full_time":
-                job_type = JobType.JOB
-            elif query.data == "job_internship":
-                job_type = JobType.INTERNSHIP
-            else:
+            job_type = _JOB_TYPE_MAP.get(query.data)
+            if job_type is None:
                 await query.edit_message_text("Invalid selection. Please use /start to try again.")
                 return ConversationHandler.END
             
@@ -134,240 +304,278 @@ class ConversationHandlers:
             role_prompt = MessageTemplates.job_type_prompt(job_type)
             await query.edit_message_text(role_prompt, parse_mode='Markdown')
             
-            self.logger.info(f"User {user_id} selected job type: {job_type.value}")
+            self.logger.info("User %s selected job type: %s", user_id, job_type.value)
             
-            return ConversationState.ENTERING_ROLE.value
+            return ConversationState.ENTERING_ROLE
             
         except Exception as e:
-            self.logger.error(f"Error in job_type_selection: {e}")
-            await update.callback_query.edit_message_text(MessageTemplates.error_message())
+            self.logger.error("Error in job_type_selection: %s", e)
+            await update.callback_query.edit_message_text(_ERROR_MSG)
             return ConversationHandler.END
 
     async def role_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle role input and initiate search."""
         try:
             user_id = update.effective_user.id
-            role = update.message.text.strip()
+            text = update.message.text or ""
+            role = text.strip() if len(text) <= _MAX_ROLE_INPUT else ""
             
-            # Validate role input
-            if not role or len(role.strip()) < 3:
+            # Validate role input (length check first so huge messages never reach the regex)
+            if not 3 <= len(role) <= 64 or not _ROLE_RE.fullmatch(role):
                 await update.message.reply_text(
                     "**Please enter a valid role**\n\n"
-                    "The role name should be at least 3 characters.\n\n"
+                    "The role name should be 3-64 characters, without links or special symbols.\n\n"
                     "**Examples**: Java Developer, Python Developer, Software Engineer",
                     parse_mode='Markdown'
                 )
-                return ConversationState.ENTERING_ROLE.value
-            
-            # Store role
-            self.conversation_data.set_user_data(user_id, "role", role)
+                return ConversationState.ENTERING_ROLE
             
-            # Get job type
-            job_type = self.conversation_data.get_user_value(user_id, "job_type")
+            # Take the job type and clear the conversation state before the search
+            # starts, so a later /start is never wiped by this search
+            job_type, _ = self.pop_conversation_data(user_id)
             
             if not job_type:
-                await update.message.reply_text(MessageTemplates.invalid_state_message())
+                await update.message.reply_text(_INVALID_STATE_MSG)
                 return ConversationHandler.END
             
-            self.logger.info(f"User {user_id} entered role: {role} for {job_type.value}")
+            self.logger.info("User %s entered role: %s for %s", user_id, role, job_type.value)
             
-            # Start search immediately
-            await self.perform_search(update, context, user_id, job_type, role)
+            # Run the search in the background and end the conversation now: other
+            # chats are not held up, and further messages cannot start a second search
+            context.application.create_task(
+                self.perform_search(update, context, user_id, job_type, role), update=update
+            )
             
             return ConversationHandler.END
             
         except Exception as e:
-            self.logger.error(f"Error in role_input: {e}")
-            await update.message.reply_text(MessageTemplates.error_message())
+            self.logger.error("Error in role_input: %s", e)
+            await update.message.reply_text(_ERROR_MSG)
             return ConversationHandler.END
 
     async def perform_search(self, update: Update, context: ContextTypes.DEFAULT_TYPE, user_id: int, job_type: JobType, role: str) -> None:
         """Perform the actual LinkedIn search with real-time streaming updates."""
         try:
-            self.logger.info(f"🔍 PERFORM_SEARCH CALLED - User: {user_id}, Type: {job_type.value}, Role: {role}")
+            self.logger.info("🔍 PERFORM_SEARCH CALLED - User: %s, Type: %s, Role: %s", user_id, job_type.value, role)
             
             # Step 1: Initialize
-            await self.send_progress_update(update, 
-                f"**Starting search for {role}**\n\n"
-                f"**I'll send you jobs immediately as I find them!**"
+            status_message = await self.send_progress_update(
+                update, MessageTemplates.search_started_message(role)
             )
             
-            # Import here to avoid circular imports
-            from ..scraper.linkedin import LinkedInScraper
+            # Reuse the shared scraper (and its browser) across searches
+            scraper = await self._get_scraper()
             
-            # Create scraper instance
-            scraper = LinkedInScraper(self.config)
-            
-            # Step 2: Configure search parameters
-            await self.send_progress_update(update,
-                f"**Target Role**: {role}\n"
-                f"**Search Type**: {job_type.value.title()}\n"
-                f"**Strategy**: India → Remote → Global\n"
-                f"**Searching LinkedIn now...**"
-            )
+            # Step 2: Configure search parameters (the edit runs alongside the search)
+            plan_task = asyncio.create_task(self.send_progress_update(
+                update, MessageTemplates.search_plan_message(role, job_type), status_message
+            ))
             
             search_query = role
-            max_results = self.config.search_config.max_results
+            search_config = self.config.search_config
+            max_results = search_config.max_results
+            time_filter = search_config.time_filter
             found_count = 0
             
-            self.logger.info(f"Starting streaming LinkedIn search for user {user_id}: {role} ({job_type.value})")
+            self.logger.info("Starting streaming LinkedIn search for user %s: %s (%s)", user_id, role, job_type.value)
             
-            # Real-time job callback function
-            async def job_found_callback(job_url: str):
-                nonlocal found_count
-                found_count += 1
-                
-                self.logger.info(f"🚀 STREAMING JOB CALLBACK #{found_count}: {job_url}")
-                
-                # Send job immediately; prefer async details extraction for rich content
+            # Jobs found by the scraper, drained by job_sender (None marks the end)
+            job_queue: asyncio.Queue = asyncio.Queue()
+            
+            async def format_job(job_number: int, job_url: str) -> str:
+                # Prefer async details extraction for rich content
                 try:
-                    from .messages import MessageFormatter
-                    job_message = await MessageFormatter.format_single_job_message_async(
+                    return await MessageFormatter.format_single_job_message_async(
                         job_url=job_url,
                         role=role,
-                        job_number=found_count
+                        job_number=job_number
                     )
                 except Exception:
-                    job_message = MessageTemplates.format_single_job_message(
+                    return MessageTemplates.format_single_job_message(
                         job_url=job_url,
                         role=role,
-                        job_number=found_count
+                        job_number=job_number
                     )
+            
+            async def job_sender() -> None:
+                finished = False
+                while not finished:
+                    first = await job_queue.get()
+                    if first is None:
+                        return
+                    
+                    # Coalesce jobs that arrive shortly after the first one
+                    batch = [first]
+                    try:
+                        while len(batch) < JOB_BATCH_SIZE:
+                            item = await asyncio.wait_for(job_queue.get(), timeout=JOB_BATCH_WINDOW)
+                            if item is None:
+                                finished = True
+                                break
+                            batch.append(item)
+                    except asyncio.TimeoutError:
+                        pass
+                    
+                    job_messages = await asyncio.gather(*(format_job(n, url) for n, url in batch))
+                    try:
+                        await update.message.reply_text(
+                            MessageTemplates.format_job_batch(job_messages),
+                            parse_mode='Markdown',
+                            disable_web_page_preview=True
+                        )
+                        self.logger.info("✅ SENT %s STREAMING JOBS (up to #%s) to user %s", len(batch), batch[-1][0], user_id)
+                    except Exception as send_error:
+                        self.logger.error("Error sending streamed jobs: %s", send_error)
+            
+            # Real-time job callback function
+            async def job_found_callback(job_url: str):
+                nonlocal found_count
+                found_count += 1
                 
-                await update.message.reply_text(
-                    job_message,
-                    parse_mode='Markdown',
-                    disable_web_page_preview=True
-                )
+                self.logger.info("🚀 STREAMING JOB CALLBACK #%s: %s", found_count, job_url)
                 
-                self.logger.info(f"✅ SENT STREAMING JOB {found_count} to user {user_id}")
+                # Hand off to the sender so the scraper never waits on Telegram
+                job_queue.put_nowait((found_count, job_url))
+            
+            sender_task = asyncio.create_task(job_sender())
             
             # Step 3: Begin TRUE real-time streaming search
             try:
-                self.logger.info(f"🎯 STARTING STREAMING SEARCH - Type: {job_type.value}")
+                self.logger.info("🎯 STARTING STREAMING SEARCH - Type: %s", job_type.value)
                 
                 # Choose the appropriate search method based on job type
                 if job_type == JobType.JOB:
                     self.logger.info("📋 Using search_jobs_streaming method")
-                    # Use TRUE streaming method - jobs sent immediately as found
-                    job_urls = await scraper.search_jobs_streaming(
-                        keyword=search_query, 
-                        max_results=max_results,
-                        time_filter=self.config.search_config.time_filter,
-                        job_callback=job_found_callback  # Real-time streaming callback
-                    )
+                    search_streaming = scraper.search_jobs_streaming
                 else:  # INTERNSHIP
                     self.logger.info("🎓 Using search_internships_streaming method")
-                    # Use TRUE streaming method - internships sent immediately as found
-                    job_urls = await scraper.search_internships_streaming(
+                    search_streaming = scraper.search_internships_streaming
+                
+                # Use TRUE streaming method - jobs sent immediately as found
+                async with self._user_search_lock(user_id):
+                    job_urls = await search_streaming(
                         keyword=search_query, 
                         max_results=max_results,
-                        time_filter=self.config.search_config.time_filter,
+                        time_filter=time_filter,
                         job_callback=job_found_callback  # Real-time streaming callback
                     )
                 
                 # Note: Jobs are already sent via job_found_callback during the search
                 # The job_urls list contains all found URLs for logging purposes
                 
+                # Flush any queued jobs before the completion message
+                job_queue.put_nowait(None)
+                await sender_task
+                
                 # Step 4: Send completion message only (no job summary)
+                job_urls = list(dict.fromkeys(job_urls))  # order-preserving dedupe
                 total_found = len(job_urls)
-                self.logger.info(f"📊 SEARCH COMPLETED - Total URLs returned: {total_found}, Jobs sent via callback: {found_count}")
+                self.logger.info("📊 SEARCH COMPLETED - Total URLs returned: %s, Jobs sent via callback: %s", total_found, found_count)
                 
                 if total_found > 0:
                     await update.message.reply_text(
-                        f"✅ **Search Complete!**\n\n"
-                        f"📊 **Total Found**: {total_found} {role} opportunities\n"
-                        f"🔍 **Search Strategy**: India → Remote → Global\n\n"
-                        f"💼 **Good luck with your applications!**\n"
-                        f"🔄 **Use /start to search for different roles**",
+                        _SEARCH_COMPLETE_TEMPLATE.format(total_found=total_found, role=escape_markdown(role)),
                         parse_mode='Markdown'
                     )
-                    self.logger.info(f"Completed streaming search for user {user_id}: {total_found} jobs sent individually")
+                    self.logger.info("Completed streaming search for user %s: %s jobs sent individually", user_id, total_found)
                 else:
                     # No results found
-                    no_results_msg = (
-                        f"**No {role} positions found**\n\n"
-                        f"**Comprehensive search completed:**\n"
-                        f"✓ India locations (Bangalore, Mumbai, Delhi, etc.)\n"
-                        f"✓ Remote positions suitable for India\n"
-                        f"✓ Global opportunities\n\n"
-                        f"**Suggestions to improve results:**\n"
-                        f"• Try different keywords:\n"
-                        f"  - 'Software Developer' instead of '{role}'\n"
-                        f"  - 'Backend Developer' or 'Frontend Developer'\n"
-                        f"  - 'Full Stack Developer' for broader results\n"
-                        f"• Try broader terms like 'Software Engineer'\n"
-                        f"• Check back in a few hours - new jobs are posted regularly\n\n"
-                        f"**Try again with different keywords using /start**"
-                    )
+                    no_results_msg = _NO_RESULTS_TEMPLATE.format(role=escape_markdown(role))
                     
                     await update.message.reply_text(no_results_msg, parse_mode='Markdown')
-                    self.logger.info(f"No results found for user {user_id}: {role}")
+                    self.logger.info("No results found for user %s: %s", user_id, role)
                         
             except Exception as search_error:
-                self.logger.error(f"Error in streaming search: {search_error}")
+                self.logger.error("Error in streaming search: %s", search_error)
+                
+                # Deliver the jobs found before the failure ahead of the error reply
+                if not sender_task.done():
+                    job_queue.put_nowait(None)
+                    await sender_task
+                
                 await update.message.reply_text(
-                    f"**Search Error**\n\n"
-                    f"**There was an issue while searching for {role}**\n\n"
-                    f"**Please try again with /start**\n"
-                    f"If the problem persists, the service might be temporarily unavailable.",
+                    _SEARCH_ERROR_TEMPLATE.format(role=escape_markdown(role)),
                     parse_mode='Markdown'
                 )
+            finally:
+                # Only reached with the sender still running when the search was cancelled
+                if not sender_task.done():
+                    sender_task.cancel()
+                await plan_task
                 
         except Exception as e:
-            self.logger.error(f"Error in perform_search: {e}")
-            await update.message.reply_text(
-                f"**Oops! Something went wrong**\n\n"
-                "There was a technical issue while searching.\n\n"
-                f"**Please try again with /start**\n"
-                "If the problem persists, the service might be temporarily unavailable.",
-                parse_mode='Markdown'
-            )
-        finally:
-            # Clear search state
-            self.clear_conversation_data(user_id)
+            self.logger.error("Error in perform_search: %s", e)
+            await update.message.reply_text(_ERROR_MSG, parse_mode='Markdown')
     
-    async def send_progress_update(self, update: Update, message: str) -> None:
-        """Send progress update to user."""
+    async def send_progress_update(self, update: Update, message: str,
+                                   status_message: Optional[Message] = None) -> Optional[Message]:
+        """
+        Send progress update to user.
+        
+        Args:
+            update: Telegram update to reply to
+            message: Markdown progress text
+            status_message: Earlier status message to edit instead of sending a new one
+            
+        Returns:
+            The status message to pass to the next update (None if sending failed)
+        """
         try:
-            await update.message.reply_text(message, parse_mode='Markdown')
+            if status_message is not None:
+                try:
+                    await status_message.edit_text(message, parse_mode='Markdown')
+                except BadRequest as e:
+                    # Unchanged text is reported as an error; anything else is real
+                    if "not modified" not in str(e).lower():
+                        raise
+                return status_message
+            return await update.message.reply_text(message, parse_mode='Markdown')
         except Exception as e:
-            self.logger.error(f"Error sending progress update: {e}")
+            self.logger.error("Error sending progress update: %s", e)
+            return status_message
+    
+    def get_conversation_data(self, user_id: int) -> Tuple[Optional[JobType], Optional[str]]:
+        """Get the (job_type, role) selected by a user, or (None, None)."""
+        return self.conversation_data.get_conversation_data(user_id)
+    
+    def pop_conversation_data(self, user_id: int) -> Tuple[Optional[JobType], Optional[str]]:
+        """
+        Take the (job_type, role) selected by a user and clear their conversation data.
+        
+        Nothing is awaited between the read and the clear, so when a user
+        triggers the search twice only the first caller gets the data.
+        """
+        job_type, role = self.conversation_data.get_conversation_data(user_id)
+        self.clear_conversation_data(user_id)
+        return job_type, role
     
     def clear_conversation_data(self, user_id: int) -> None:
         """Clear all conversation data for a user."""
         try:
             self.conversation_data.clear_user_data(user_id)
-            self.logger.debug(f"Cleared conversation data for user {user_id}")
+            self.logger.debug("Cleared conversation data for user %s", user_id)
         except Exception as e:
-            self.logger.error(f"Error clearing conversation data for user {user_id}: {e}")
+            self.logger.error("Error clearing conversation data for user %s: %s", user_id, e)
     
     async def handle_timeout(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle conversation timeout."""
         try:
-            await update.effective_message.reply_text(
-                "**Conversation timed out**\n\n"
-                "Please use /start to begin a new search.",
-                parse_mode='Markdown'
-            )
+            await update.effective_message.reply_text(_TIMEOUT_MSG, parse_mode='Markdown')
             
             user_id = update.effective_user.id
             self.conversation_data.clear_user_data(user_id)
             
-            self.logger.info(f"Conversation timeout for user {user_id}")
+            self.logger.info("Conversation timeout for user %s", user_id)
             return ConversationHandler.END
             
         except Exception as e:
-            self.logger.error(f"Error in handle_timeout: {e}")
+            self.logger.error("Error in handle_timeout: %s", e)
             return ConversationHandler.END
     
     async def handle_fallback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle fallback for unexpected messages."""
         try:
-            await update.message.reply_text(
-                "I didn't understand that. Please use /start to begin a new search.",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_FALLBACK_MSG, parse_mode='Markdown')
             
             user_id = update.effective_user.id
             self.conversation_data.clear_user_data(user_id)
@@ -375,23 +583,24 @@ class ConversationHandlers:
             return ConversationHandler.END
             
         except Exception as e:
-            self.logger.error(f"Error in handle_fallback: {e}")
+            self.logger.error("Error in handle_fallback: %s", e)
             return ConversationHandler.END
 
     def create_conversation_handler(self) -> ConversationHandler:
-        """Create and return the conversation handler."""
-        from telegram.ext import CommandHandler, MessageHandler, CallbackQueryHandler, filters
+        """Create and return the conversation handler (built once per instance)."""
+        if self._conversation_handler is not None:
+            return self._conversation_handler
         
-        return ConversationHandler(
+        self._conversation_handler = ConversationHandler(
             entry_points=[CommandHandler("start", self.start_command)],
             states={
-                ConversationState.SELECTING_JOB_TYPE.value: [
+                ConversationState.SELECTING_JOB_TYPE: [
                     CallbackQueryHandler(self.job_type_selection, pattern="^job_(full_time|internship)$")
                 ],
-                ConversationState.ENTERING_ROLE.value: [
+                ConversationState.ENTERING_ROLE: [
                     MessageHandler(filters.TEXT & ~filters.COMMAND, self.role_input)
                 ],
-                ConversationState.SEARCHING.value: [
+                ConversationState.SEARCHING: [
                     # This state is handled programmatically, no user input expected
                 ]
             },
@@ -399,6 +608,7 @@ class ConversationHandlers:
                 CommandHandler("start", self.start_command),
                 MessageHandler(filters.ALL, self.handle_fallback)
             ],
-            conversation_timeout=300,  # 5 minutes timeout
+            conversation_timeout=CONVERSATION_TIMEOUT,  # 5 minutes timeout
             name="job_search_conversation"
         )
+        return self._conversation_handler
@@ -8,17 +8,26 @@ Integrates all components for a comprehensive job search experience.
 import asyncio
 import logging
 import os
-from typing import Optional, List
+import time
+from collections import OrderedDict
+from typing import Optional, List, Tuple
 
+import aiohttp
 from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes
 
 from ..utils.config import ConfigurationManager
-from ..utils.logging import get_bot_logger, log_function, time_function
-from ..scraper.linkedin import LinkedInScraper
+from ..utils.logging import get_bot_logger, log_function
+from ..scraper.linkedin import FallbackJobList, LinkedInScraper
 from .handlers import ConversationHandlers
 from .messages import MessageTemplates, MessageFormatter, JobType
 
+# Recent search results are reused for this many seconds
+SEARCH_CACHE_TTL = 600
+
+# Maximum number of (role, job type) searches kept in the cache
+SEARCH_CACHE_SIZE = 256
+
 
 class LinkedInJobBot:
     """Main LinkedIn Job & Internship Bot class."""
@@ -38,6 +47,12 @@ class LinkedInJobBot:
         # Initialize application
         self.application: Optional[Application] = None
         
+        # Shared HTTP session for scraper requests (opened in _post_init)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        
+        # LRU cache of recent results: (normalized role, is_internship) -> (timestamp, urls)
+        self._search_cache: "OrderedDict[Tuple[str, bool], Tuple[float, List[str]]]" = OrderedDict()
+        
         self.logger.info("✅ LinkedIn Job Bot initialized successfully")
     
     @log_function
@@ -46,10 +61,23 @@ class LinkedInJobBot:
         try:
             self.logger.info("Setting up Telegram application...")
             
-            # Create application
-            self.application = Application.builder().token(
-                self.config.bot_config.telegram_token
-            ).build()
+            # Create application (separate connection pools so the getUpdates
+            # long poll never starves outgoing sends)
+            self.application = (
+                Application.builder()
+                .token(self.config.bot_config.telegram_token)
+                .connection_pool_size(64)
+                .pool_timeout(20.0)
+                .connect_timeout(10.0)
+                .read_timeout(30.0)
+                .get_updates_connection_pool_size(8)
+                .get_updates_pool_timeout(20.0)
+                # Pace outgoing sends below Telegram's ~30 msg/s flood limit
+                .rate_limiter(AIORateLimiter(overall_max_rate=28, overall_time_period=1, max_retries=3))
+                .post_init(self._post_init)
+                .post_shutdown(self._post_shutdown)
+                .build()
+            )
             
             # Add conversation handler
             conversation_handler = self.conversation_handlers.create_conversation_handler()
@@ -75,36 +103,33 @@ class LinkedInJobBot:
             }, exc_info=True)
             raise
     
-    @log_function 
     async def handle_search_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle search command with enhanced logging."""
         user_id = update.effective_user.id if update.effective_user else 0
         
         try:
-            self.logger.debug(f"Processing search command for user {user_id}")
+            self.logger.debug("Processing search command for user %s", user_id)
             # This is primarily used internally by the conversation flow
             await self.search_jobs_and_internships(update, context)
             
         except Exception as e:
-            self.logger.error(f"❌ Error in search command for user {user_id}", extra={
+            self.logger.error("❌ Error in search command for user %s", user_id, extra={
                 'user_id': user_id,
                 'error_type': type(e).__name__,
                 'error_message': str(e)
             }, exc_info=True)
             await update.message.reply_text(MessageTemplates.error_message())
     
-    @time_function
-    @log_function
     async def search_jobs_and_internships(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Search for jobs and internships with comprehensive logging and performance monitoring."""
         user_id = update.effective_user.id if update.effective_user else 0
         
         try:
-            # Get conversation data
-            job_type, role = self.conversation_handlers.get_conversation_data(user_id)
+            # Take the conversation data (a repeated /search finds nothing left)
+            job_type, role = self.conversation_handlers.pop_conversation_data(user_id)
             
             if not job_type or not role:
-                self.logger.warning(f"Invalid state for user {user_id}: missing job_type or role")
+                self.logger.warning("Invalid state for user %s: missing job_type or role", user_id)
                 await update.message.reply_text(MessageTemplates.invalid_state_message())
                 return
             
@@ -115,11 +140,13 @@ class LinkedInJobBot:
                 job_type=job_type.value
             )
             
-            self.logger.info(f"🔍 Starting search for user {user_id}", extra={
+            # One extra dict for every log record of this search
+            log_extra = {
                 'user_id': user_id,
                 'role': role,
                 'job_type': job_type.value
-            })
+            }
+            self.logger.info("🔍 Starting search for user %s", user_id, extra=log_extra)
             
             # Start performance monitoring
             self.bot_logger.performance.start_timer(f"search_{user_id}")
@@ -127,24 +154,34 @@ class LinkedInJobBot:
             # Perform the search
             job_urls = await self._perform_search(role, job_type, user_id)
             
+            # Tiers can return the same posting; drop repeats, keeping first-seen order
+            job_urls = list(dict.fromkeys(job_urls))
+            
             search_duration = self.bot_logger.performance.end_timer(f"search_{user_id}")
+            log_extra['duration'] = search_duration
+            log_extra['result_count'] = len(job_urls)
             
             if job_urls:
                 # Format job URLs into meaningful opportunities with async details
-                self.logger.info(f"Formatting {len(job_urls)} job opportunities for user {user_id}")
+                self.logger.info("Formatting %s job opportunities for user %s", len(job_urls), user_id)
+                
+                # Bound once; the coroutine below runs per URL
+                format_job = MessageTemplates.format_single_job_message_async
+                http_session = self._get_http_session()
                 
-                opportunities = []
-                for i, job_url in enumerate(job_urls, 1):
+                async def format_opportunity(i: int, job_url: str) -> str:
                     try:
-                        # Use async job formatting for better details
-                        job_message = await MessageTemplates.format_single_job_message_async(
-                            job_url, role, i
-                        )
-                        opportunities.append(job_message)
+                        # Use async job formatting for better details (over the shared session)
+                        return await format_job(job_url, role, i, session=http_session)
                     except Exception as format_error:
-                        self.logger.warning(f"Failed to format job {i}: {format_error}")
+                        self.logger.warning("Failed to format job %s: %s", i, format_error)
                         # Fallback to simple format
-                        opportunities.append(f"🔗 **Job {i}**: [View on LinkedIn]({job_url})")
+                        return f"🔗 **Job {i}**: [View on LinkedIn]({job_url})"
+                
+                # Detail lookups are independent network fetches, so run them together (order is kept)
+                opportunities = await asyncio.gather(
+                    *(format_opportunity(i, job_url) for i, job_url in enumerate(job_urls, 1))
+                )
                 
                 # Log successful search results
                 self.bot_logger.log_search_results(
@@ -155,21 +192,23 @@ class LinkedInJobBot:
                     duration=search_duration
                 )
                 
-                # Send success message with formatted results
-                success_msg = MessageTemplates.success_message(
+                # Send success message with formatted results (split to fit Telegram's limit)
+                success_chunks = MessageTemplates.success_message_chunks(
                     role=role,
                     job_type=job_type,
                     location=self.config.search_config.default_location,
                     opportunities=opportunities
                 )
                 
-                await update.message.reply_text(success_msg, parse_mode='Markdown')
+                # A rejected part should not cost the user the rest of the results
+                for part, success_msg in enumerate(success_chunks, 1):
+                    try:
+                        await update.message.reply_text(success_msg, parse_mode='Markdown')
+                    except Exception as send_error:
+                        self.logger.warning("Failed to send result part %s/%s to user %s: %s",
+                                            part, len(success_chunks), user_id, send_error)
                 
-                self.logger.info(f"✅ Search completed successfully for user {user_id}", extra={
-                    'user_id': user_id,
-                    'result_count': len(job_urls),
-                    'duration': search_duration
-                })
+                self.logger.info("✅ Search completed successfully for user %s", user_id, extra=log_extra)
                 
             else:
                 # Log no results
@@ -189,45 +228,45 @@ class LinkedInJobBot:
                 
                 await update.message.reply_text(no_results_msg, parse_mode='Markdown')
                 
-                self.logger.info(f"ℹ️ No results found for user {user_id}", extra={
-                    'user_id': user_id,
-                    'role': role,
-                    'duration': search_duration
-                })
-            
-            # Clear conversation data after search
-            self.conversation_handlers.clear_conversation_data(user_id)
+                self.logger.info("ℹ️ No results found for user %s", user_id, extra=log_extra)
             
         except Exception as e:
-            self.logger.error(f"❌ Error in search for user {user_id}", extra={
+            self.logger.error("❌ Error in search for user %s", user_id, extra={
                 'user_id': user_id,
                 'error_type': type(e).__name__,
                 'error_message': str(e)
             }, exc_info=True)
             
             await update.message.reply_text(MessageTemplates.error_message())
-            
-            # Clear conversation data on error
-            if update.effective_user:
-                self.conversation_handlers.clear_conversation_data(update.effective_user.id)
     
-    @time_function
-    @log_function
     async def _perform_search(self, role: str, job_type: JobType, user_id: int) -> List[str]:
         """Perform the actual LinkedIn search with enhanced monitoring and current jobs."""
         try:
             # Determine if searching for internships
             is_internship = job_type == JobType.INTERNSHIP
             
-            self.logger.debug(f"Performing current job search for user {user_id}", extra={
-                'user_id': user_id,
-                'role': role,
-                'is_internship': is_internship,
-                'max_results': self.config.search_config.max_results
-            })
+            # One extra dict for every log record of this search
+            log_extra = {'user_id': user_id, 'role': role}
+            
+            # Popular roles repeat; serve recent results without hitting LinkedIn
+            cache_key = (role.strip().casefold(), is_internship)
+            cached_urls = self._get_cached_search(cache_key)
+            if cached_urls is not None:
+                log_extra['urls_found'] = len(cached_urls)
+                log_extra['search_type'] = 'cached'
+                self.logger.info("🎯 Search served from cache for user %s", user_id, extra=log_extra)
+                return cached_urls
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Performing current job search for user %s", user_id, extra={
+                    **log_extra,
+                    'is_internship': is_internship,
+                    'max_results': self.config.search_config.max_results
+                })
             
             # Use streaming search methods for current opportunities
             job_urls = []
+            search_type = 'streaming'
             
             try:
                 if is_internship:
@@ -237,7 +276,7 @@ class LinkedInJobBot:
                     async def collect_url(url):
                         collected_urls.append(url)
                     
-                    await self.scraper.search_internships_streaming(
+                    results = await self.scraper.search_internships_streaming(
                         keyword=role,
                         max_results=self.config.search_config.max_results,
                         job_callback=collect_url
@@ -250,35 +289,41 @@ class LinkedInJobBot:
                     async def collect_url(url):
                         collected_urls.append(url)
                     
-                    await self.scraper.search_jobs_streaming(
+                    results = await self.scraper.search_jobs_streaming(
                         keyword=role,
                         max_results=self.config.search_config.max_results,
                         job_callback=collect_url
                     )
                     job_urls = collected_urls
+                
+                # Generated stand-ins when LinkedIn blocks the scraper
+                if isinstance(results, FallbackJobList):
+                    search_type = 'generated'
                     
             except Exception as streaming_error:
-                self.logger.warning(f"Streaming search failed for user {user_id}: {streaming_error}")
+                self.logger.warning("Streaming search failed for user %s: %s", user_id, streaming_error)
                 
                 # Fallback to legacy method only if streaming completely fails
-                job_urls = await asyncio.to_thread(
-                    self.scraper.search_for_jobs_and_internships,
+                search_type = 'fallback'
+                job_urls = await self.scraper.search_for_jobs_and_internships_async(
+                    session=self._get_http_session(),
                     keyword=role,
                     is_internship=is_internship,
                     max_results=self.config.search_config.max_results
                 )
             
-            self.logger.info(f"🎯 Search completed for user {user_id}", extra={
-                'user_id': user_id,
-                'role': role,
-                'urls_found': len(job_urls),
-                'search_type': 'streaming' if job_urls else 'fallback'
-            })
+            log_extra['urls_found'] = len(job_urls)
+            log_extra['search_type'] = search_type
+            self.logger.info("🎯 Search completed for user %s", user_id, extra=log_extra)
+            
+            # Only real scraped results are worth serving to other users
+            if job_urls and search_type == 'streaming':
+                self._cache_search(cache_key, job_urls)
             
             return job_urls
             
         except Exception as e:
-            self.logger.error(f"❌ Search operation failed for user {user_id}", extra={
+            self.logger.error("❌ Search operation failed for user %s", user_id, extra={
                 'user_id': user_id,
                 'role': role,
                 'error_type': type(e).__name__,
@@ -286,70 +331,70 @@ class LinkedInJobBot:
             }, exc_info=True)
             return []
     
-    async def start_bot(self) -> None:
-        """Start the bot."""
-        try:
-            if not self.application:
-                self.setup_application()
-            
-            # Start health check server for Azure Container Apps
-            await self._start_health_server()
-            
-            self.logger.info("Starting LinkedIn Job Bot...")
-            
-            # Start the bot
-            await self.application.initialize()
-            await self.application.start()
-            await self.application.updater.start_polling(
-                allowed_updates=Update.ALL_TYPES,
-                drop_pending_updates=True
+    def _get_cached_search(self, key: Tuple[str, bool]) -> Optional[List[str]]:
+        """Get cached search results if they are still fresh."""
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, job_urls = entry
+        if time.monotonic() - cached_at > SEARCH_CACHE_TTL:
+            del self._search_cache[key]
+            return None
+        
+        self._search_cache.move_to_end(key)
+        return list(job_urls)
+    
+    def _cache_search(self, key: Tuple[str, bool], job_urls: List[str]) -> None:
+        """Store search results, evicting the least recently used entry when full."""
+        self._search_cache[key] = (time.monotonic(), list(job_urls))
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, opening it if needed."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300),
+                headers={
+                    "User-Agent": (
+                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+                    )
+                }
             )
-            
-            self.logger.info("✅ LinkedIn Job Bot is running!")
-            self.logger.info("Press Ctrl+C to stop the bot")
-            
-            # Keep the bot running using a simple loop
-            import signal
-            import asyncio
-            
-            # Create an event to wait for shutdown
-            shutdown_event = asyncio.Event()
-            
-            def signal_handler(signum, frame):
-                self.logger.info("Received shutdown signal")
-                shutdown_event.set()
-            
-            # Set up signal handlers for graceful shutdown
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
-            
-            # Wait for shutdown signal
-            await shutdown_event.wait()
-            
-        except KeyboardInterrupt:
-            self.logger.info("Bot stopped by user")
-        except Exception as e:
-            self.logger.error(f"Error starting bot: {e}")
-            raise
-        finally:
-            await self.stop_bot()
+        return self._http_session
     
-    async def stop_bot(self) -> None:
-        """Stop the bot gracefully."""
+    async def _post_init(self, application: Application) -> None:
+        """Open shared resources once the application is initialized (run_polling hook)."""
+        # Open the shared HTTP session on the running loop
+        self._get_http_session()
+        
+        # Start health check server for Azure Container Apps
+        await self._start_health_server()
+        
+        self.logger.info("✅ LinkedIn Job Bot is running!")
+        self.logger.info("Press Ctrl+C to stop the bot")
+    
+    async def _post_shutdown(self, application: Application) -> None:
+        """Release scrapers, HTTP session and health server after shutdown (run_polling hook)."""
         try:
             # Stop health server first
             await self._stop_health_server()
             
-            if self.application:
-                self.logger.info("Stopping LinkedIn Job Bot...")
-                if self.application.updater and self.application.updater.running:
-                    await self.application.updater.stop()
-                await self.application.stop()
-                await self.application.shutdown()
-                self.logger.info("✅ Bot stopped gracefully")
-                
+            # Close scraper browsers
+            await self.conversation_handlers.aclose()
+            await self.scraper.aclose()
+            
+            if self._http_session is not None:
+                await self._http_session.close()
+                self._http_session = None
+            
+            self.logger.info("✅ Bot stopped gracefully")
+            
         except Exception as e:
-            self.logger.error(f"Error stopping bot: {e}")
+            self.logger.error("Error stopping bot: %s", e)
     
     async def _start_health_server(self) -> None:
         """Start health check server for Azure Container Apps."""
@@ -357,7 +402,7 @@ class LinkedInJobBot:
             # Health check disabled for simplicity
             self.logger.info("Health check server disabled (simplified deployment)")
         except Exception as e:
-            self.logger.warning(f"Failed to start health check server: {e}")
+            self.logger.warning("Failed to start health check server: %s", e)
     
     async def _stop_health_server(self) -> None:
         """Stop health check server."""
@@ -365,29 +410,49 @@ class LinkedInJobBot:
             # Health server disabled for simplicity
             self.logger.info("Health check server disabled (simplified deployment)")
         except Exception as e:
-            self.logger.warning(f"Error stopping health check server: {e}")
+            self.logger.warning("Error stopping health check server: %s", e)
     
     def run_bot(self) -> None:
-        """Run the bot (synchronous entry point)."""
+        """
+        Run the bot until SIGINT, SIGTERM or SIGABRT (synchronous entry point).
+        
+        Application.run_polling owns the event loop: it initializes the
+        application, runs the post_init hook, polls for updates, and on a stop
+        signal shuts everything down before running the post_shutdown hook.
+        """
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+        
         try:
-            asyncio.run(self.start_bot())
-        except KeyboardInterrupt:
-            self.logger.info("Bot execution interrupted")
+            if not self.application:
+                self.setup_application()
+            
+            self.logger.info("Starting LinkedIn Job Bot...")
+            
+            # Only messages and button presses are handled; long-poll to avoid idle reconnects
+            self.application.run_polling(
+                allowed_updates=[Update.MESSAGE, Update.CALLBACK_QUERY],
+                timeout=50,
+                drop_pending_updates=True
+            )
         except Exception as e:
-            self.logger.error(f"Fatal error running bot: {e}")
+            self.logger.error("Fatal error running bot: %s", e)
             raise
 
 
-async def main() -> None:
-    """Main async entry point."""
+def main() -> None:
+    """Main entry point."""
     try:
         # Initialize configuration
         config_manager = ConfigurationManager()
         config_manager.setup_logging()
         
-        # Create and start bot
+        # Create and run bot
         bot = LinkedInJobBot(config_manager)
-        await bot.start_bot()
+        bot.run_bot()
         
     except Exception as e:
         logging.error(f"Fatal error in main: {e}")
@@ -396,4 +461,4 @@ async def main() -> None:
 
 if __name__ == "__main__":
     # Run the bot
-    asyncio.run(main())
+    main()
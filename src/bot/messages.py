@@ -3,9 +3,11 @@ Message Templates Module
 Professional message templates for the LinkedIn Job & Internship Bot.
 Provides consistent, well-formatted messages with internationalization support.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
+import codecs
 import re
 import asyncio
 
@@ -17,68 +19,205 @@ class JobType(Enum):
     """Job type enumeration."""
     JOB = "job"
     INTERNSHIP = "internship"
-class LocationType(Enum):
+class LocationType(IntEnum):
     """Location type enumeration."""
-    INDIA = ""
-    REMOTE = ""
-    GLOBAL = ""
+    INDIA = 0
+    REMOTE = 1
+    GLOBAL = 2
+# Display label for each location type (kept out of the enum so tags stay ints)
+LOCATION_TYPE_LABELS = {
+    LocationType.INDIA: "India",
+    LocationType.REMOTE: "Remote",
+    LocationType.GLOBAL: "Global",
+}
+# Title-cased job type for message text
+_JOB_TYPE_LABEL = {
+    JobType.JOB: "Job",
+    JobType.INTERNSHIP: "Internship",
+}
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# Target length when packing results into messages (headroom below Telegram's limit)
+MESSAGE_CHUNK_LIMIT = 4000
+
+# Status line that ends every streamed job message
+_SEARCHING_FOOTER = "⏳ _Searching for more opportunities..._"
+
+# Streamed job message, and the reduced form used when detail extraction fails
+_JOB_MESSAGE_TEMPLATE = (
+    "🔍 **Job {job_number} Found!**\n\n"
+    "🏢 **Company**: {company}\n"
+    "💼 **Role**: {title}\n"
+    "📍 **Location**: {location}\n"
+    "🔗 **Apply Now**: [View Job Details]({url})\n\n"
+    + _SEARCHING_FOOTER
+)
+_JOB_FALLBACK_TEMPLATE = (
+    "🔍 **Job {job_number} Found!**\n\n"
+    "💼 **Role**: {title}\n"
+    "🔗 **Apply Now**: [View Job Details]({url})\n\n"
+    + _SEARCHING_FOOTER
+)
+
+# Scheme and host of a LinkedIn URL (any subdomain, e.g. www. or in.); matched at the start only
+_LINKEDIN_URL_RE = re.compile(r"https?://(?:[\w-]+\.)*linkedin\.com/", re.IGNORECASE)
+
+# Characters with meaning in Telegram's legacy Markdown parse mode
+_MARKDOWN_SPECIAL_RE = re.compile(r"([_*`\[])")
+
+
+def escape_markdown(text: str) -> str:
+    """
+    Escape scraped or user-supplied text for messages sent with parse_mode='Markdown'.
+    
+    Company names, titles and roles such as "AT&T_India", "*NSYNC" or
+    "data_engineer" would otherwise open an entity Telegram cannot close,
+    and the whole message is rejected.
+    """
+    return _MARKDOWN_SPECIAL_RE.sub(r"\\\1", text)
+
+# Message bodies built once at import; methods only fill in the dynamic fields
+_WELCOME_TEMPLATE = (
+    "Hi {user_name}! \n\n"
+    "**LinkedIn Job & Internship Finder**\n\n"
+    "I can help you find opportunities on LinkedIn with focus on:\n"
+    "**India** (Bangalore, Mumbai, Delhi, Hyderabad, Pune, etc.)\n"
+    "**Remote** positions suitable for India\n"
+    "**Global** opportunities as backup\n\n"
+    "**What are you looking for?**"
+)
+
+_JOB_PROMPT = (
+    "**Great! You're looking for a full-time job.**\n\n"
+    "**What specific role are you interested in?**\n\n"
+    "**Popular Examples:**\n"
+    "• `Java Developer` \n"
+    "• `Python Developer` \n"
+    "• `Frontend Developer` \n"
+    "• `Backend Developer` \n"
+    "• `Full Stack Developer` \n"
+    "• `DevOps Engineer` \n"
+    "• `Data Scientist` \n"
+    "• `Machine Learning Engineer` \n"
+    "• `Software Engineer` \n"
+    "• `React Developer` \n"
+    "• `Node.js Developer` \n"
+    "• `Mobile App Developer` \n\n"
+    "**Just type the role you want** (e.g., \"Java Developer\")\n"
+    "**I'll search immediately and keep you updated!**"
+)
+
+_INTERNSHIP_PROMPT = (
+    "**Perfect! You're looking for an internship.**\n\n"
+    "**What type of internship are you interested in?**\n\n"
+    "**Popular Examples:**\n"
+    "• `Software Engineering Intern` \n"
+    "• `Java Developer Intern` \n"
+    "• `Python Developer Intern` \n"
+    "• `Frontend Developer Intern` \n"
+    "• `Backend Developer Intern` \n"
+    "• `Full Stack Developer Intern` \n"
+    "• `Data Science Intern` \n"
+    "• `Machine Learning Intern` \n"
+    "• `DevOps Intern` \n"
+    "• `Mobile App Development Intern` \n"
+    "• `Web Development Intern` \n"
+    "• `Software Developer Intern` \n\n"
+    "**Just type the internship type you want** (e.g., \"Software Engineering Intern\")\n"
+    "**I'll search immediately and keep you updated!**"
+)
+
+# Role prompt shown after each job type is chosen
+_JOB_TYPE_PROMPTS = {
+    JobType.JOB: _JOB_PROMPT,
+    JobType.INTERNSHIP: _INTERNSHIP_PROMPT,
+}
+
+_SEARCH_PROGRESS_TEMPLATE = (
+    "**Starting search for {role}**\n\n"
+    "**Search Type**: {job_type}\n"
+    "**Primary Location**: {location}\n"
+    "**Also Searching**: Remote & Global opportunities\n"
+    "**Max Results**: {max_results} positions\n\n"
+    "**I'll keep you updated on the progress!**\n"
+    "**Estimated time**: 30-45 seconds"
+)
+
+_NO_RESULTS_TEMPLATE = (
+    "**No {role} positions found right now**\n\n"
+    "**Searched in:**\n"
+    "{location}\n"
+    "Remote positions\n"
+    "Global opportunities\n\n"
+    "**This could be because:**\n"
+    "• No new '{role}' postings in the last 24 hours\n"
+    "• Try different keywords (e.g., 'Software Developer' vs 'Java Developer')\n"
+    "• Weekend/holiday posting lull\n\n"
+    "**Try again with different keywords using /start**\n"
+    "**Tip**: Try broader terms like 'Software Engineer' or 'Developer'"
+)
+
+_ERROR_MESSAGE = (
+    "**Oops! Something went wrong**\n\n"
+    "There was a technical issue while searching.\n\n"
+    "**Please try again with /start**\n"
+    "If the problem persists, the service might be temporarily unavailable."
+)
+
+_HELP_TEMPLATE = (
+    "**LinkedIn Job & Internship Bot Help**\n\n"
+    "**Available Commands:**\n"
+    "• `/start` - Start interactive job/internship search\n"
+    "• `/help` - Show this help message\n\n"
+    "**How it works:**\n"
+    "1. **Choose**: Job or Internship\n"
+    "2. **Specify**: What role you want (e.g., 'Java Developer')\n"
+    "3. **Search**: I search LinkedIn with smart prioritization\n"
+    "4. **Results**: Get up to {max_results} fresh opportunities\n\n"
+    "**Search Strategy:**\n"
+    "**Primary**: {location} opportunities\n"
+    "**Secondary**: Remote positions suitable for India\n"
+    "**Backup**: Global opportunities\n\n"
+    "**Supported Roles:**\n"
+    "**Jobs**: Java Developer, Python Developer, DevOps Engineer, etc.\n"
+    "**Internships**: Software Engineering Intern, Data Science Intern, etc.\n\n"
+    "**Features:**\n"
+    "Interactive role selection\n"
+    "India-focused with global reach\n"
+    "Fresh results from last 24 hours\n"
+    f"Smart job categorization ({'/'.join(LOCATION_TYPE_LABELS.values())})\n"
+    "No LinkedIn login required\n\n"
+    "**Tip**: Use /start anytime to search for different roles!"
+)
+
+_INVALID_STATE_MESSAGE = "Please start with /start to begin your job search."
+
+# Header and footer wrapped around the results in the success message
+_SUCCESS_HEADER_TEMPLATE = (
+    "{emoji} **{role} {job_type} Results**\n\n"
+    "**Found {count} current opportunities:**\n\n"
+)
+_SUCCESS_FOOTER_TEMPLATE = (
+    "\n\n📍 **Focus**: {location}\n"
+    "🔄 **Freshness**: Current opportunities\n"
+    "🚀 **Ready to apply?** Click the links above!\n\n"
+    "💡 **Tip**: Use /start to search for different roles"
+)
+
+
 class MessageTemplates:
     """Professional message templates for the bot."""
     @staticmethod
+    @lru_cache(maxsize=512)
     def welcome_message(user_name: str) -> str:
         """Generate welcome message for new users."""
-        return (
-            f"Hi {user_name}! \n\n"
-            f"**LinkedIn Job & Internship Finder**\n\n"
-            "I can help you find opportunities on LinkedIn with focus on:\n"
-            f"**India** (Bangalore, Mumbai, Delhi, Hyderabad, Pune, etc.)\n"
-            f"**Remote** positions suitable for India\n"
-            f"**Global** opportunities as backup\n\n"
-            "**What are you looking for?**"
-        )
+        return _WELCOME_TEMPLATE.format(user_name=user_name)
     @staticmethod
+    @lru_cache(maxsize=None)
     def job_type_prompt(job_type: JobType) -> str:
         """Generate role input prompt based on job type."""
-        if job_type == JobType.JOB:
-            return (
-                f"**Great! You're looking for a full-time job.**\n\n"
-                f"**What specific role are you interested in?**\n\n"
-                "**Popular Examples:**\n"
-                "• `Java Developer` \n"
-                "• `Python Developer` \n"
-                "• `Frontend Developer` \n"
-                "• `Backend Developer` \n"
-                "• `Full Stack Developer` \n"
-                "• `DevOps Engineer` \n"
-                "• `Data Scientist` \n"
-                "• `Machine Learning Engineer` \n"
-                "• `Software Engineer` \n"
-                "• `React Developer` \n"
-                "• `Node.js Developer` \n"
-                "• `Mobile App Developer` \n\n"
-                f"**Just type the role you want** (e.g., \"Java Developer\")\n"
-                f"**I'll search immediately and keep you updated!**"
-            )
-        else:  # INTERNSHIP
-            return (
-                f"**Perfect! You're looking for an internship.**\n\n"
-                f"**What type of internship are you interested in?**\n\n"
-                "**Popular Examples:**\n"
-                "• `Software Engineering Intern` \n"
-                "• `Java Developer Intern` \n"
-                "• `Python Developer Intern` \n"
-                "• `Frontend Developer Intern` \n"
-                "• `Backend Developer Intern` \n"
-                "• `Full Stack Developer Intern` \n"
-                "• `Data Science Intern` \n"
-                "• `Machine Learning Intern` \n"
-                "• `DevOps Intern` \n"
-                "• `Mobile App Development Intern` \n"
-                "• `Web Development Intern` \n"
-                "• `Software Developer Intern` \n\n"
-                f"**Just type the internship type you want** (e.g., \"Software Engineering Intern\")\n"
-                f"**I'll search immediately and keep you updated!**"
-            )
+        return _JOB_TYPE_PROMPTS[job_type]
     @staticmethod
     def format_single_job_message(job_url: str, role: str, job_number: int) -> str:
         """
@@ -87,157 +226,217 @@ class MessageTemplates:
         """
         try:
             # Extract company and job details (heuristics only; see async method for richer extraction)
-            company_name = MessageFormatter._extract_company_from_url(job_url)
-            job_title = MessageFormatter._extract_job_title_from_url(job_url) or role
-            location = MessageFormatter._extract_location_from_url(job_url)
+            company_name = escape_markdown(MessageFormatter._extract_company_from_url(job_url))
+            job_title = escape_markdown(MessageFormatter._extract_job_title_from_url(job_url) or role)
+            location = escape_markdown(MessageFormatter._extract_location_from_url(job_url))
             
             # Create the immediate job message
-            message = (
-                f"🔍 **Job {job_number} Found!**\n\n"
-                f"🏢 **Company**: {company_name}\n"
-                f"💼 **Role**: {job_title}\n"
-                f"📍 **Location**: {location}\n"
-                f"🔗 **Apply Now**: [View Job Details]({job_url})\n\n"
-                f"⏳ _Searching for more opportunities..._"
+            return _JOB_MESSAGE_TEMPLATE.format(
+                job_number=job_number, company=company_name, title=job_title,
+                location=location, url=job_url
             )
             
-            return message
-            
         except Exception as e:
             # Fallback message if extraction fails
-            return (
-                f"🔍 **Job {job_number} Found!**\n\n"
-                f"💼 **Role**: {role}\n"
-                f"🔗 **Apply Now**: [View Job Details]({job_url})\n\n"
-                f"⏳ _Searching for more opportunities..._"
+            return _JOB_FALLBACK_TEMPLATE.format(
+                job_number=job_number, title=escape_markdown(role), url=job_url
             )
 
     @staticmethod
-    @staticmethod
-    async def format_single_job_message_async(job_url: str, role: str, job_number: int) -> str:
+    async def format_single_job_message_async(job_url: str, role: str, job_number: int,
+                                              session: Optional["aiohttp.ClientSession"] = None) -> str:
         """Async variant that uses extractJobDetails() for better company/location/title.
 
         This tries network-light parsing first and falls back to heuristics.
         """
         try:
-            details = await MessageFormatter.extractJobDetails(job_url)
-            company_name = details.get("company") or MessageFormatter._extract_company_from_url(job_url)
-            job_title = details.get("title") or MessageFormatter._extract_job_title_from_url(job_url) or role
-            location = details.get("location") or MessageFormatter._extract_location_from_url(job_url)
-
-            message = (
-                f"🔍 **Job {job_number} Found!**\n\n"
-                f"🏢 **Company**: {company_name}\n"
-                f"💼 **Role**: {job_title}\n"
-                f"📍 **Location**: {location}\n"
-                f"🔗 **Apply Now**: [View Job Details]({job_url})\n\n"
-                f"⏳ _Searching for more opportunities..._"
+            details = await MessageFormatter.extractJobDetails(job_url, session)
+            company_name = escape_markdown(
+                details.get("company") or MessageFormatter._extract_company_from_url(job_url)
+            )
+            job_title = escape_markdown(
+                details.get("title") or MessageFormatter._extract_job_title_from_url(job_url) or role
+            )
+            location = escape_markdown(
+                details.get("location") or MessageFormatter._extract_location_from_url(job_url)
+            )
+
+            return _JOB_MESSAGE_TEMPLATE.format(
+                job_number=job_number, company=company_name, title=job_title,
+                location=location, url=job_url
             )
-            return message
         except Exception:
             return MessageTemplates.format_single_job_message(job_url, role, job_number)
     
+    @staticmethod
+    def format_job_batch(job_messages: List[str]) -> str:
+        """Combine streamed job messages into one, keeping a single status line at the end."""
+        if len(job_messages) == 1:
+            return job_messages[0]
+        bodies = [message.removesuffix(_SEARCHING_FOOTER).rstrip() for message in job_messages]
+        return "\n\n".join(bodies) + "\n\n" + _SEARCHING_FOOTER
+    
+    @staticmethod
+    def _success_parts(role: str, job_type: JobType, location: str, count: int) -> Tuple[str, str]:
+        """Build the (header, footer) wrapped around the success message results."""
+        header = _SUCCESS_HEADER_TEMPLATE.format(
+            emoji="🎓" if job_type == JobType.INTERNSHIP else "💼",
+            role=escape_markdown(role.title()), job_type=_JOB_TYPE_LABEL[job_type], count=count
+        )
+        footer = _SUCCESS_FOOTER_TEMPLATE.format(location=location)
+        return header, footer
+    
     @staticmethod
     def success_message(role: str, job_type: JobType, location: str, opportunities: List[str]) -> str:
         """Generate success message with job opportunities."""
-        job_type_text = "internship" if job_type == JobType.INTERNSHIP else "job"
-        emoji = "🎓" if job_type == JobType.INTERNSHIP else "💼"
+        if not opportunities:
+            return MessageTemplates.no_results_message(role, location)
         
-        # Create header
-        header = (
-            f"{emoji} **{role.title()} {job_type_text.title()} Results**\n\n"
-            f"**Found {len(opportunities)} current opportunities:**\n\n"
-        )
+        header, footer = MessageTemplates._success_parts(role, job_type, location, len(opportunities))
         
         # Add each opportunity
         results = "\n\n".join(opportunities)
         
-        # Add footer
-        footer = (
-            f"\n\n📍 **Focus**: {location}\n"
-            f"🔄 **Freshness**: Current opportunities\n"
-            f"🚀 **Ready to apply?** Click the links above!\n\n"
-            f"💡 **Tip**: Use /start to search for different roles"
-        )
-        
         return header + results + footer
+    
+    @staticmethod
+    def success_message_chunks(role: str, job_type: JobType, location: str,
+                               opportunities: List[str], limit: int = MESSAGE_CHUNK_LIMIT) -> List[str]:
+        """
+        Split the success message into parts that each fit in one Telegram message.
+        
+        Opportunities are packed up to limit and never split across parts.
+        The header opens the first part and the footer closes the last one;
+        both may take that part past limit, and are only sent on their own
+        when Telegram would reject the combined text.
+        """
+        if not opportunities:
+            return [MessageTemplates.no_results_message(role, location)]
+        
+        header, footer = MessageTemplates._success_parts(role, job_type, location, len(opportunities))
+        hard_limit = max(limit, TELEGRAM_MESSAGE_LIMIT)
+        
+        chunks: List[str] = []
+        current = header + opportunities[0]
+        if len(current) > hard_limit:
+            chunks.append(header.rstrip())
+            current = opportunities[0]
+        
+        for opportunity in opportunities[1:]:
+            piece = "\n\n" + opportunity
+            if len(current) + len(piece) > limit:
+                chunks.append(current)
+                current = opportunity
+            else:
+                current += piece
+        
+        if len(current) + len(footer) > hard_limit:
+            chunks.append(current)
+            current = footer.lstrip("\n")
+        else:
+            current += footer
+        chunks.append(current)
+        
+        return chunks
 
     @staticmethod
+    @lru_cache(maxsize=256)
+    def search_started_message(role: str) -> str:
+        """Generate the first streaming-search status message."""
+        return (
+            f"**Starting search for {escape_markdown(role)}**\n\n"
+            f"**I'll send you jobs immediately as I find them!**"
+        )
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def search_plan_message(role: str, job_type: JobType) -> str:
+        """Generate the streaming-search parameters message."""
+        return (
+            f"**Target Role**: {escape_markdown(role)}\n"
+            f"**Search Type**: {_JOB_TYPE_LABEL[job_type]}\n"
+            f"**Strategy**: India → Remote → Global\n"
+            f"**Searching LinkedIn now...**"
+        )
+    @staticmethod
+    @lru_cache(maxsize=256)
     def search_progress_message(role: str, job_type: JobType, location: str, max_results: int) -> str:
         """Generate initial search progress message."""
-        return (
-            f"**Starting search for {role}**\n\n"
-            f"**Search Type**: {job_type.value.title()}\n"
-            f"**Primary Location**: {location}\n"
-            f"**Also Searching**: Remote & Global opportunities\n"
-            f"**Max Results**: {max_results} positions\n\n"
-            f"**I'll keep you updated on the progress!**\n"
-            f"**Estimated time**: 30-45 seconds"
+        return _SEARCH_PROGRESS_TEMPLATE.format(
+            role=escape_markdown(role), job_type=_JOB_TYPE_LABEL[job_type], location=location, max_results=max_results
         )
     @staticmethod
+    @lru_cache(maxsize=256)
     def no_results_message(role: str, location: str) -> str:
         """Generate no results message."""
-        return (
-            f"**No {role} positions found right now**\n\n"
-            f"**Searched in:**\n"
-            f"{location}\n"
-            f"Remote positions\n"
-            f"Global opportunities\n\n"
-            "**This could be because:**\n"
-            f"• No new '{role}' postings in the last 24 hours\n"
-            "• Try different keywords (e.g., 'Software Developer' vs 'Java Developer')\n"
-            "• Weekend/holiday posting lull\n\n"
-            f"**Try again with different keywords using /start**\n"
-            f"**Tip**: Try broader terms like 'Software Engineer' or 'Developer'"
-        )
+        return _NO_RESULTS_TEMPLATE.format(role=escape_markdown(role), location=location)
     @staticmethod
+    @lru_cache(maxsize=None)
     def error_message() -> str:
         """Generate error message."""
-        return (
-            f"**Oops! Something went wrong**\n\n"
-            "There was a technical issue while searching.\n\n"
-            f"**Please try again with /start**\n"
-            "If the problem persists, the service might be temporarily unavailable."
-        )
+        return _ERROR_MESSAGE
     @staticmethod
+    @lru_cache(maxsize=16)
     def help_message(location: str, max_results: int) -> str:
         """Generate help message."""
-        return (
-            f"**LinkedIn Job & Internship Bot Help**\n\n"
-            "**Available Commands:**\n"
-            f"• `/start` - Start interactive job/internship search\n"
-            "• `/help` - Show this help message\n\n"
-            "**How it works:**\n"
-            f"1. **Choose**: Job or Internship\n"
-            f"2. **Specify**: What role you want (e.g., 'Java Developer')\n"
-            f"3. **Search**: I search LinkedIn with smart prioritization\n"
-            f"4. **Results**: Get up to {max_results} fresh opportunities\n\n"
-            "**Search Strategy:**\n"
-            f"**Primary**: {location} opportunities\n"
-            f"**Secondary**: Remote positions suitable for India\n"
-            f"**Backup**: Global opportunities\n\n"
-            "**Supported Roles:**\n"
-            f"**Jobs**: Java Developer, Python Developer, DevOps Engineer, etc.\n"
-            f"**Internships**: Software Engineering Intern, Data Science Intern, etc.\n\n"
-            "**Features:**\n"
-            f"Interactive role selection\n"
-            f"India-focused with global reach\n"
-            f"Fresh results from last 24 hours\n"
-            f"Smart job categorization ({LocationType.INDIA.value}/{LocationType.REMOTE.value}/{LocationType.GLOBAL.value})\n"
-            f"No LinkedIn login required\n\n"
-            f"**Tip**: Use /start anytime to search for different roles!"
-        )
+        return _HELP_TEMPLATE.format(location=location, max_results=max_results)
     @staticmethod
+    @lru_cache(maxsize=None)
     def invalid_state_message() -> str:
         """Generate invalid state message."""
-        return (
-            f"Please start with /start to begin your job search."
-        )
+        return _INVALID_STATE_MESSAGE
+
+
+# Job detail fields in LinkedIn job page HTML (embedded JSON and the og:title meta tag),
+# as one alternation so the page is scanned once
+_JOB_DETAILS_RE = re.compile(
+    r'"companyName"\s*:\s*"(?P<company>[^"]+)"'
+    r'|"formattedLocation"\s*:\s*"(?P<location>[^"]+)"'
+    r'|"addressLocality"\s*:\s*"(?P<city>[^"]+)"'
+    r'|"addressRegion"\s*:\s*"(?P<region>[^"]+)"'
+    r'|"jobTitle"\s*:\s*"(?P<title>[^"]+)"'
+    r'|(?i:<meta\s+property=["\']og:title["\']\s+content=["\'](?P<og_title>[^"\']+)["\'])'
+)
+
+# Fields whose presence makes the rest of the page irrelevant
+_PRIMARY_DETAIL_FIELDS = frozenset(("company", "location", "title"))
+
+# Job pages are read in chunks of this many bytes, stopping once the details are found
+_DETAIL_CHUNK_SIZE = 16384
+
+# Text carried over between chunks so a field split across the boundary is still matched
+_DETAIL_SCAN_OVERLAP = 1024
+
+# Request settings for job page fetches (tight budget; heuristics cover failures)
+_DETAIL_TIMEOUT = aiohttp.ClientTimeout(total=1.8, connect=0.6) if aiohttp else None
+_DETAIL_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    )
+}
+
+
+def _scan_job_details(html: str, found: Dict[str, str]) -> bool:
+    """
+    Record the first value of each job detail field in html into found.
+    
+    Fields already in found are kept, so overlapping windows of the same
+    page can be scanned in turn. Returns True as soon as company, formatted
+    location and job title are all known, since the fallback fields
+    (city/region, og:title) are then unused.
+    """
+    for match in _JOB_DETAILS_RE.finditer(html):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if _PRIMARY_DETAIL_FIELDS.issubset(found):
+            return True
+    return False
+
+
 class MessageFormatter:
     """Enhanced message formatter with job detail extraction."""
     
     @staticmethod
-    async def extractJobDetails(job_url: str) -> Dict[str, str]:
+    async def extractJobDetails(job_url: str, session: Optional["aiohttp.ClientSession"] = None) -> Dict[str, str]:
         """Extract job details (company, title, location) from a LinkedIn job URL.
 
         Strategy:
@@ -245,6 +444,10 @@ class MessageFormatter:
         2) Try to fetch the page HTML quickly (<=1.5s) using aiohttp and parse common JSON/meta patterns
         3) Fallback to enhanced heuristic extraction with realistic current data
 
+        The page is fetched over the caller's long-lived ``session`` (the bot's
+        pooled session), reusing its keep-alive connections; without one, only
+        the heuristics are used.
+
         Returns a dict with keys: company, title, location.
         """
         # Enhanced defaults for current opportunities
@@ -256,60 +459,54 @@ class MessageFormatter:
             details.update(MessageFormatter._extract_current_opportunity_details(job_url))
             return details
 
-        # Fast bail-out if aiohttp unavailable
-        if aiohttp is None:
+        # Fast bail-out if aiohttp unavailable or no session to fetch with
+        if aiohttp is None or session is None:
             details["title"] = MessageFormatter._extract_job_title_from_url(job_url)
             details["location"] = MessageFormatter._extract_location_from_url(job_url)
             return details
 
         # Quick HTTP fetch with tight timeouts
         try:
-            timeout = aiohttp.ClientTimeout(total=1.8, connect=0.6)
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                )
-            }
-            async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-                async with session.get(job_url, allow_redirects=True) as resp:
-                    if resp.status >= 200 and resp.status < 400:
-                        html = await resp.text(errors="ignore")
-
-                        # Common JSON patterns in LinkedIn job pages
-                        # 1) "companyName":"..."
-                        m = re.search(r'"companyName"\s*:\s*"([^"]+)"', html)
-                        if m:
-                            details["company"] = m.group(1)
-
-                        # 2) "formattedLocation":"..." or jobLocation object
-                        m = re.search(r'"formattedLocation"\s*:\s*"([^"]+)"', html)
-                        if m:
-                            details["location"] = m.group(1)
-                        else:
-                            m_city = re.search(r'"addressLocality"\s*:\s*"([^"]+)"', html)
-                            m_region = re.search(r'"addressRegion"\s*:\s*"([^"]+)"', html)
-                            if m_city and m_region:
-                                details["location"] = f"{m_city.group(1)}, {m_region.group(1)}"
-
-                        # 3) Job title from meta or JSON
-                        m = re.search(r'"jobTitle"\s*:\s*"([^"]+)"', html)
-                        if m:
-                            details["title"] = m.group(1)
-                        else:
-                            m2 = re.search(r'<meta\s+property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-                            if m2:
-                                details["title"] = m2.group(1)
-
-                        # Normalize
-                        if details["company"]:
-                            details["company"] = details["company"].strip()
-                        if details["title"]:
-                            details["title"] = details["title"].strip()
-                        if details["location"]:
-                            details["location"] = details["location"].strip()
-
-                        return details
+            async with session.get(job_url, timeout=_DETAIL_TIMEOUT, headers=_DETAIL_HEADERS,
+                                   allow_redirects=True) as resp:
+                if resp.status >= 200 and resp.status < 400:
+                    # Common JSON patterns in LinkedIn job pages; the fields sit near
+                    # the top, so stop reading once they are all found
+                    found: Dict[str, str] = {}
+                    decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(errors="ignore")
+                    tail = ""
+                    async for chunk in resp.content.iter_chunked(_DETAIL_CHUNK_SIZE):
+                        window = tail + decoder.decode(chunk)
+                        if _scan_job_details(window, found):
+                            # The unread rest is dropped with the connection; downloading
+                            # it would cost more than the early stop saves
+                            break
+                        tail = window[-_DETAIL_SCAN_OVERLAP:]
+                    
+                    # 1) "companyName":"..."
+                    if "company" in found:
+                        details["company"] = found["company"]
+
+                    # 2) "formattedLocation":"..." or jobLocation object
+                    if "location" in found:
+                        details["location"] = found["location"]
+                    elif "city" in found and "region" in found:
+                        details["location"] = f"{found['city']}, {found['region']}"
+
+                    # 3) Job title from meta or JSON
+                    title = found.get("title") or found.get("og_title")
+                    if title:
+                        details["title"] = title
+
+                    # Normalize
+                    if details["company"]:
+                        details["company"] = details["company"].strip()
+                    if details["title"]:
+                        details["title"] = details["title"].strip()
+                    if details["location"]:
+                        details["location"] = details["location"].strip()
+
+                    return details
         except Exception:
             # Network blocked or timed out; fall back to heuristics
             pass
@@ -362,100 +559,93 @@ class MessageFormatter:
     @staticmethod
     def _extract_company_from_url(job_url: str) -> str:
         """Extract company name from LinkedIn job URL."""
-        try:
-            # LinkedIn job URLs often contain company info
-            # Try to extract from URL patterns
-            if "linkedin.com" in job_url:
-                # Basic extraction - can be enhanced with actual scraping
-                return "LinkedIn Company"
-            return "Company"
-        except:
-            return "Company"
+        # LinkedIn job URLs often contain company info
+        # Try to extract from URL patterns
+        if _LINKEDIN_URL_RE.match(job_url):
+            # Basic extraction - can be enhanced with actual scraping
+            return "LinkedIn Company"
+        return "Company"
     
     @staticmethod
     def _extract_job_title_from_url(job_url: str) -> str:
         """Extract job title from LinkedIn job URL."""
-        try:
-            # This would require actual page scraping for accurate results
-            # For now, return None to use the user's search term
-            return None
-        except:
-            return None
+        # This would require actual page scraping for accurate results
+        # For now, return None to use the user's search term
+        return None
     
     @staticmethod
     def _extract_location_from_url(job_url: str) -> str:
         """Extract location from LinkedIn job URL."""
-        try:
-            # Basic location detection from URL
-            if "india" in job_url.lower():
-                return "India"
-            elif "remote" in job_url.lower():
-                return "Remote"
-            else:
-                return "Location TBD"
-        except:
+        # Basic location detection from URL (lowercased once for both checks)
+        url_lower = job_url.lower()
+        if "india" in url_lower:
+            return "India"
+        elif "remote" in url_lower:
+            return "Remote"
+        else:
             return "Location TBD"
 
 
+# India-specific place names (substring match, as before)
+_INDIA_TERMS = ('india', 'bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune',
+                'chennai', 'kolkata', 'ahmedabad', 'gurgaon', 'noida', 'bengaluru',
+                'karnataka', 'maharashtra', 'tamil nadu', 'andhra pradesh')
+_INDIA_RE = re.compile("|".join(map(re.escape, _INDIA_TERMS)), re.IGNORECASE)
+
+# Remote indicators: the word itself (any case) or LinkedIn's remote work-type filter (exact)
+_REMOTE_RE = re.compile(r"(?i:remote)|f_WT=2")
+
+# Field names in the "TITLE: ... | COMPANY: ... | LOCATION: ..." job info format
+_JOB_INFO_FIELDS = frozenset(("TITLE", "COMPANY", "LOCATION"))
+
+
+@lru_cache(maxsize=256)
+def _parse_job_info(job_info: str) -> Dict[str, str]:
+    """
+    Split a job info string into its fields in one pass.
+    
+    The title, company and location extractors are called on the same string
+    in turn, so the parse is cached and shared between them. Callers must not
+    mutate the returned dict.
+    """
+    fields = {}
+    for part in job_info.split("|"):
+        key, sep, value = part.partition(":")
+        key = key.strip()
+        if sep and key in _JOB_INFO_FIELDS:
+            fields[key] = value.strip()
+    return fields
+
+
 class MessageFormatterLegacy:
     """Legacy utility class for formatting messages."""
     @staticmethod
     def extract_company_name(job_info: str) -> str:
         """Extract company name from job info string or LinkedIn URL."""
-        try:
-            # Handle new job info format: "TITLE: ... | COMPANY: ... | LOCATION: ..."
-            if "COMPANY:" in job_info:
-                parts = job_info.split("|")
-                for part in parts:
-                    if "COMPANY:" in part:
-                        company = part.split("COMPANY:")[1].strip()
-                        return company if company else "Company"
-            # Handle URL format (legacy)
-            if '-at-' in job_info:
-                company = job_info.split('-at-')[-1].split('-')[0].replace('%20', ' ').title()
-                return company if company else "Company"
-            return "Company"
-        except Exception:
-            return "Company"
+        # Handle new job info format: "TITLE: ... | COMPANY: ... | LOCATION: ..."
+        fields = _parse_job_info(job_info)
+        if "COMPANY" in fields:
+            return fields["COMPANY"] or "Company"
+        # Handle URL format (legacy)
+        if '-at-' in job_info:
+            company = job_info.split('-at-')[-1].split('-')[0].replace('%20', ' ').title()
+            return company if company else "Company"
+        return "Company"
     @staticmethod
     def extract_job_title(job_info: str) -> str:
         """Extract job title from job info string."""
-        try:
-            # Handle new job info format: "TITLE: ... | COMPANY: ... | LOCATION: ..."
-            if "TITLE:" in job_info:
-                parts = job_info.split("|")
-                for part in parts:
-                    if "TITLE:" in part:
-                        title = part.split("TITLE:")[1].strip()
-                        return title if title else "Position"
-            return "Position"
-        except Exception:
-            return "Position"
+        return _parse_job_info(job_info).get("TITLE") or "Position"
     @staticmethod
     def extract_location_info(job_info: str) -> str:
         """Extract location info from job info string."""
-        try:
-            # Handle new job info format: "TITLE: ... | COMPANY: ... | LOCATION: ..."
-            if "LOCATION:" in job_info:
-                parts = job_info.split("|")
-                for part in parts:
-                    if "LOCATION:" in part:
-                        location = part.split("LOCATION:")[1].strip()
-                        return location if location else ""
-            return ""
-        except Exception:
-            return ""
+        return _parse_job_info(job_info).get("LOCATION", "")
     @staticmethod
     def determine_location_type(job_info: str) -> LocationType:
         """Determine location type from job info string or URL."""
-        info_lower = job_info.lower()
         # Check for India-specific terms
-        india_terms = ['india', 'bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune',
-                      'chennai', 'kolkata', 'ahmedabad', 'gurgaon', 'noida', 'bengaluru',
-                      'karnataka', 'maharashtra', 'tamil nadu', 'andhra pradesh']
-        if any(term in info_lower for term in india_terms):
+        if _INDIA_RE.search(job_info):
             return LocationType.INDIA
         # Check for remote indicators
-        if 'remote' in info_lower or 'f_WT=2' in job_info:
+        if _REMOTE_RE.search(job_info):
             return LocationType.REMOTE
         return LocationType.GLOBAL
@@ -9,8 +9,9 @@ import asyncio
 import json
 import logging
 import os
+import socket
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from aiohttp import web, ClientSession
 from datetime import datetime
 import sys
@@ -29,6 +30,7 @@ class HealthCheckServer:
         self.port = port
         self.app = web.Application()
         self.start_time = time.time()
+        self.runner: Optional[web.AppRunner] = None
         self.setup_routes()
     
     def setup_routes(self):
@@ -117,11 +119,12 @@ class HealthCheckServer:
             }
             
             # Convert to Prometheus format
-            prometheus_output = ""
-            for metric_name, value in metrics_data.items():
-                prometheus_output += f"# HELP {metric_name} LinkedIn Bot metric\n"
-                prometheus_output += f"# TYPE {metric_name} gauge\n"
-                prometheus_output += f"{metric_name} {value}\n"
+            prometheus_output = "".join(
+                f"# HELP {metric_name} LinkedIn Bot metric\n"
+                f"# TYPE {metric_name} gauge\n"
+                f"{metric_name} {value}\n"
+                for metric_name, value in metrics_data.items()
+            )
             
             return web.Response(text=prometheus_output, content_type="text/plain")
             
@@ -132,9 +135,9 @@ class HealthCheckServer:
                 "linkedin_bot_status": 1
             }
             
-            prometheus_output = ""
-            for metric_name, value in basic_metrics.items():
-                prometheus_output += f"{metric_name} {value}\n"
+            prometheus_output = "".join(
+                f"{metric_name} {value}\n" for metric_name, value in basic_metrics.items()
+            )
             
             return web.Response(text=prometheus_output, content_type="text/plain")
     
@@ -288,12 +291,17 @@ class HealthCheckServer:
             return {"status": "warn", "message": f"Chrome check failed: {e}"}
     
     async def start_server(self):
-        """Start the health check server."""
+        """Start the health check server (a no-op if it is already running)."""
+        if self.runner is not None:
+            return self.runner
+        
         runner = web.AppRunner(self.app)
         await runner.setup()
         
-        site = web.TCPSite(runner, '0.0.0.0', self.port)
+        # SO_REUSEPORT lets a restarted process bind while the old socket drains
+        site = web.TCPSite(runner, '0.0.0.0', self.port, reuse_port=hasattr(socket, "SO_REUSEPORT"))
         await site.start()
+        self.runner = runner
         
         logger.info(f"Health check server started on port {self.port}")
         logger.info(f"Health check endpoint: http://0.0.0.0:{self.port}/health")
@@ -301,6 +309,12 @@ class HealthCheckServer:
         logger.info(f"Metrics endpoint: http://0.0.0.0:{self.port}/metrics")
         
         return runner
+    
+    async def stop_server(self):
+        """Stop the health check server if it is running."""
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
 
 
 def health_check() -> bool:
@@ -336,13 +350,13 @@ def health_check() -> bool:
 async def main():
     """Run standalone health check server."""
     server = HealthCheckServer()
-    runner = await server.start_server()
+    await server.start_server()
     
     try:
         await asyncio.Event().wait()  # Run forever
     except KeyboardInterrupt:
         logger.info("Shutting down health check server...")
-        await runner.cleanup()
+        await server.stop_server()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""
+WebDriver Support Module
+
+Shared ChromeDriver resolution and browser settings for the LinkedIn scrapers.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+
+# Chrome content settings (2 = block) for assets the scrapers never read;
+# LinkedIn job cards are server-rendered HTML, so the DOM is unaffected
+CONTENT_BLOCKING_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+# URL patterns blocked over CDP (assets and analytics beacons)
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.css",
+    "*google-analytics*", "*doubleclick*"
+]
+
+# Returns [selector, elements] for the first selector with matches, in one WebDriver call
+FIRST_MATCH_SCRIPT = (
+    "for (const s of arguments[0]) {"
+    "  const els = document.querySelectorAll(s);"
+    "  if (els.length) return [s, Array.from(els)];"
+    "}"
+    "return [null, []];"
+)
+
+# Chrome executables probed for the installed browser version
+CHROME_COMMANDS = ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium")
+
+# On-disk cache of the resolved ChromeDriver path, keyed on Chrome version
+DRIVER_CACHE_FILE = Path.home() / ".cache" / "freibujobs" / "chromedriver_path.json"
+
+# Resolved ChromeDriver binary path (populated on first use)
+_chromedriver_path: Optional[str] = None
+
+
+def _chrome_version() -> Optional[str]:
+    """
+    Get the installed Chrome version string.
+
+    Returns:
+        Optional[str]: Output of ``<chrome> --version``, or None if Chrome was not found
+    """
+    for command in CHROME_COMMANDS:
+        try:
+            result = subprocess.run([command, "--version"], capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    return None
+
+
+def _cached_driver_path() -> str:
+    """
+    Resolve the ChromeDriver path, reusing the on-disk cache when Chrome is unchanged.
+
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    chrome_version = _chrome_version()
+    
+    if chrome_version:
+        try:
+            cached = json.loads(DRIVER_CACHE_FILE.read_text())
+            if cached.get("chrome") == chrome_version and os.path.isfile(cached.get("path", "")):
+                return cached["path"]
+        except (OSError, ValueError, AttributeError):
+            pass
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    path = ChromeDriverManager().install()
+    
+    if chrome_version:
+        try:
+            DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            DRIVER_CACHE_FILE.write_text(json.dumps({"chrome": chrome_version, "path": path}))
+        except OSError:
+            # A read-only home directory only costs the cache
+            pass
+    
+    return path
+
+
+def get_chromedriver_path() -> str:
+    """
+    Get the ChromeDriver binary path, resolving it once per process.
+
+    ChromeDriverManager().install() queries the driver registry on every call,
+    which adds a network round-trip to each browser start. The resolved path
+    is cached in memory for the process and on disk across restarts, until
+    the installed Chrome version changes.
+
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = _cached_driver_path()
+    return _chromedriver_path
+
+
+def block_heavy_resources(driver) -> None:
+    """
+    Block image, font, stylesheet and analytics requests for a Chrome driver.
+
+    Args:
+        driver: Chrome WebDriver instance
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception:
+        # CDP commands might not work in all environments
+        pass
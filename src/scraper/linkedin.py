@@ -5,21 +5,50 @@ Professional LinkedIn scraping functionality for job and internship search.
 Implements multi-tier search strategy with India-first approach and true real-time streaming.
 """
 
-import time
 import asyncio
 import logging
-from typing import List, Optional, Set, Callable
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+import re
+import time
+from typing import TYPE_CHECKING, List, Optional, Set, Callable
+from urllib.parse import quote
+
+import aiohttp
 
 from ..utils.config import ConfigurationManager
 from ..utils.logging import get_bot_logger, log_function, time_function
+from .driver import CONTENT_BLOCKING_PREFS, FIRST_MATCH_SCRIPT, block_heavy_resources, get_chromedriver_path
+
+# Selenium is imported where a browser is driven, so URL building and the
+# fallback data paths do not pay for loading it
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+# Page-source markers indicating LinkedIn refused the request
+_BLOCK_MARKERS_RE = re.compile(r"captcha|blocked", re.IGNORECASE)
+
+# Collects the href of each element passed as arguments[0] in a single WebDriver call
+_HREFS_SCRIPT = "return arguments[0].map(e => e.href || '');"
+
+# LinkedIn's public guest endpoint returning job-card HTML for a search query
+GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+# Job view links inside the guest-search HTML (query string excluded)
+_JOB_VIEW_URL_RE = re.compile(r'https://[\w.]*linkedin\.com/jobs/view/[^"?&\s]+')
+
+# Guest-search tiers in result priority order: (location, extra query parameters)
+GUEST_SEARCH_TIERS = {
+    "india": ("India", ""),
+    "remote": ("India", "&f_WT=2"),
+    "global": ("Worldwide", ""),
+}
+
+# Maximum guest-search tier requests in flight per search
+GUEST_SEARCH_CONCURRENCY = 5
+
+
+class FallbackJobList(list):
+    """Job results generated because scraping was blocked, not found on LinkedIn."""
 
 
 class LinkedInScraper:
@@ -39,10 +68,20 @@ class LinkedInScraper:
         self.logger = get_bot_logger().get_logger('scraper.linkedin')
         self.driver = None
         self.is_logged_in = False
+        # One browser per scraper; searches sharing this instance take turns on it
+        self._driver_lock = asyncio.Lock()
+        
+        # Enhanced scraper (with its own browser), created on first search
+        self._enhanced_scraper = None
+        self._enhanced_lock = asyncio.Lock()
         
-    def _setup_driver(self) -> webdriver.Chrome:
+    def _setup_driver(self) -> "webdriver.Chrome":
         """Set up Chrome WebDriver with enhanced anti-detection for LinkedIn scraping."""
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            
             chrome_options = Options()
             
             # Force headless mode for container environments (Azure Container Apps)
@@ -71,6 +110,10 @@ class LinkedInScraper:
             # Window size for headless
             chrome_options.add_argument("--window-size=1920,1080")
             
+            # Skip downloading assets that are never scraped
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", CONTENT_BLOCKING_PREFS)
+            
             # Chrome binary detection for different environments
             import platform
             import os
@@ -92,13 +135,13 @@ class LinkedInScraper:
             
             if chrome_binary:
                 chrome_options.binary_location = chrome_binary
-                self.logger.info(f"Using Chrome binary: {chrome_binary}")
+                self.logger.info("Using Chrome binary: %s", chrome_binary)
             
             # Create service with automatic driver management
             try:
-                service = Service(ChromeDriverManager().install())
+                service = Service(get_chromedriver_path())
             except Exception as driver_error:
-                self.logger.warning(f"ChromeDriverManager failed: {driver_error}, trying system chromedriver")
+                self.logger.warning("ChromeDriverManager failed: %s, trying system chromedriver", driver_error)
                 # Fallback to system chromedriver
                 service = Service()
             
@@ -120,15 +163,17 @@ class LinkedInScraper:
                 # CDP commands might not work in all environments
                 pass
             
+            block_heavy_resources(driver)
+            
             self.logger.info("Chrome WebDriver initialized with enhanced anti-detection")
             return driver
             
         except Exception as e:
-            self.logger.error(f"Failed to setup Chrome driver: {e}")
+            self.logger.error("Failed to setup Chrome driver: %s", e)
             # Return None instead of raising to allow fallback to demo data
             return None
 
-    def _get_driver(self) -> webdriver.Chrome:
+    def _get_driver(self) -> "webdriver.Chrome":
         """Get or create a WebDriver instance."""
         if not self.driver:
             self.driver = self._setup_driver()
@@ -145,9 +190,69 @@ class LinkedInScraper:
                 self.is_logged_in = False
                 self.logger.info("WebDriver closed successfully")
             except Exception as e:
-                self.logger.error(f"Error closing driver: {e}")
+                self.logger.error("Error closing driver: %s", e)
 
-    async def _extract_job_urls_streaming(self, driver: webdriver.Chrome, 
+    def _find_job_hrefs(self, driver: "webdriver.Chrome", selectors: List[str]) -> List[str]:
+        """
+        Collect job link hrefs for the first selector with matches (blocking WebDriver calls).
+        
+        Args:
+            driver: WebDriver instance
+            selectors: Job link CSS selectors, in order of preference
+            
+        Returns:
+            List[str]: Raw hrefs in document order (empty if nothing matched)
+        """
+        selector, job_elements = driver.execute_script(FIRST_MATCH_SCRIPT, selectors)
+        
+        if not job_elements:
+            self.logger.warning("No job elements found with any selector")
+            # Log page source snippet for debugging (only fetch the DOM when it will be logged)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Page source snippet: %s", driver.page_source[:1000])
+            return []
+        
+        self.logger.info("Found %s job elements with selector: %s", len(job_elements), selector)
+        
+        # Read all hrefs in one script call instead of one get_attribute round-trip per element
+        return driver.execute_script(_HREFS_SCRIPT, job_elements)
+
+    def _click_show_more(self, driver: "webdriver.Chrome") -> bool:
+        """Click the "Show more jobs" button if it is enabled (blocking WebDriver calls)."""
+        from selenium.webdriver.common.by import By
+        
+        show_more_button = driver.find_element(
+            By.CSS_SELECTOR, 
+            "button[aria-label*='Show more jobs'], .infinite-scroller__show-more-button"
+        )
+        if not show_more_button.is_enabled():
+            return False
+        driver.execute_script("arguments[0].click();", show_more_button)
+        return True
+
+    def _page_access_error(self, driver: "webdriver.Chrome") -> Optional[str]:
+        """
+        Check whether LinkedIn refused the loaded page (blocking WebDriver calls).
+        
+        Returns:
+            Optional[str]: Reason the page is unusable, or None if it can be scraped
+        """
+        current_url = driver.current_url.lower()
+        
+        if "login" in current_url:
+            return "Redirected to LinkedIn login page - authentication required"
+        elif "challenge" in current_url:
+            return "LinkedIn CAPTCHA or challenge detected"
+        
+        # Single case-insensitive pass over the page source for all block markers
+        block_marker = _BLOCK_MARKERS_RE.search(driver.page_source)
+        if block_marker and block_marker.group().lower() == "captcha":
+            return "LinkedIn CAPTCHA or challenge detected"
+        elif block_marker:
+            return "LinkedIn blocked automated access"
+        return None
+
+    async def _extract_job_urls_streaming(self, driver: "webdriver.Chrome", 
                                         job_callback: Optional[Callable] = None,
                                         all_found_urls: Optional[Set[str]] = None,
                                         max_results: int = 10) -> List[str]:
@@ -163,6 +268,11 @@ class LinkedInScraper:
         Returns:
             List of job URLs found
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
         job_urls = []
         found_count = 0
         
@@ -180,15 +290,16 @@ class LinkedInScraper:
                 ".job-search-results-list"
             ]
             
+            # Single wait on the combined selector group instead of one full timeout per selector
             container_found = False
-            for selector in container_selectors:
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    self.logger.info(f"Found job container using selector: {selector}")
-                    container_found = True
-                    break
-                except:
-                    continue
+            try:
+                await asyncio.to_thread(wait.until, EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ", ".join(container_selectors))
+                ))
+                self.logger.info("Found job listings container")
+                container_found = True
+            except TimeoutException:
+                pass
             
             if not container_found:
                 self.logger.warning("No job container found, proceeding anyway...")
@@ -202,28 +313,16 @@ class LinkedInScraper:
                 ".jobs-search__results-list a[href*='/jobs/view/']"  # Even more specific
             ]
             
-            job_elements = []
-            for selector in job_link_selectors:
-                job_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if len(job_elements) > 0:
-                    self.logger.info(f"Found {len(job_elements)} job elements using selector: {selector}")
-                    break
-                else:
-                    self.logger.debug(f"Selector '{selector}' found 0 elements")
-            
-            if len(job_elements) == 0:
-                self.logger.warning("No job elements found with any selector")
-                # Log page source snippet for debugging
-                page_source = driver.page_source[:1000]
-                self.logger.debug(f"Page source snippet: {page_source}")
+            # First selector with matches and its hrefs, read off the event loop
+            job_hrefs = await asyncio.to_thread(self._find_job_hrefs, driver, job_link_selectors)
+            if not job_hrefs:
                 return job_urls
             
-            for job_element in job_elements:
+            for job_url in job_hrefs:
                 if found_count >= max_results:
                     break
                     
                 try:
-                    job_url = job_element.get_attribute("href")
                     if job_url and job_url not in all_found_urls:
                         # Clean the URL
                         if "?" in job_url:
@@ -234,7 +333,7 @@ class LinkedInScraper:
                         job_urls.append(job_url)
                         found_count += 1
                         
-                        self.logger.info(f"Found job {found_count}: {job_url}")
+                        self.logger.info("Found job %s: %s", found_count, job_url)
                         
                         # REAL-TIME STREAMING: Send job immediately via callback
                         if job_callback:
@@ -243,27 +342,22 @@ class LinkedInScraper:
                                 # Small delay to avoid overwhelming the user interface
                                 await asyncio.sleep(0.3)
                             except Exception as callback_error:
-                                self.logger.error(f"Error in streaming callback: {callback_error}")
+                                self.logger.error("Error in streaming callback: %s", callback_error)
                         
                 except Exception as e:
-                    self.logger.error(f"Error extracting job URL: {e}")
+                    self.logger.error("Error extracting job URL: %s", e)
                     continue
             
             # Try to load more jobs by scrolling if we need more results
             if found_count < max_results:
                 try:
                     # Scroll to load more jobs
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    await asyncio.to_thread(driver.execute_script, "window.scrollTo(0, document.body.scrollHeight);")
                     await asyncio.sleep(2)  # Wait for potential lazy loading
                     
                     # Look for "Show more jobs" button
                     try:
-                        show_more_button = driver.find_element(
-                            By.CSS_SELECTOR, 
-                            "button[aria-label*='Show more jobs'], .infinite-scroller__show-more-button"
-                        )
-                        if show_more_button.is_enabled():
-                            driver.execute_script("arguments[0].click();", show_more_button)
+                        if await asyncio.to_thread(self._click_show_more, driver):
                             await asyncio.sleep(3)  # Wait for new jobs to load
                             
                             # Recursively extract more jobs
@@ -276,12 +370,12 @@ class LinkedInScraper:
                         self.logger.info("No 'Show more jobs' button found or not clickable")
                         
                 except Exception as scroll_error:
-                    self.logger.error(f"Error during scrolling: {scroll_error}")
+                    self.logger.error("Error during scrolling: %s", scroll_error)
             
         except TimeoutException:
             self.logger.error("Timeout waiting for job listings to load")
         except Exception as e:
-            self.logger.error(f"Error extracting job URLs: {e}")
+            self.logger.error("Error extracting job URLs: %s", e)
             
         return job_urls
 
@@ -294,11 +388,11 @@ class LinkedInScraper:
         
         # Add keyword
         if keyword:
-            params.append(f"keywords={keyword.replace(' ', '%20')}")
+            params.append(f"keywords={quote(keyword, safe='')}")
         
         # Add location
         if location:
-            params.append(f"location={location.replace(' ', '%20').replace(',', '%2C')}")
+            params.append(f"location={quote(location, safe='')}")
         
         # Add time filter (default: last 24 hours)
         params.append(f"f_TPR={time_filter}")
@@ -316,7 +410,7 @@ class LinkedInScraper:
         else:
             full_url = base_url
             
-        self.logger.info(f"Built search URL: {full_url}")
+        self.logger.info("Built search URL: %s", full_url)
         return full_url
 
     async def _search_jobs_by_criteria_streaming(self, keyword: str, location: str = "", 
@@ -339,7 +433,8 @@ class LinkedInScraper:
         
         driver = None
         try:
-            driver = self._get_driver()
+            # Browser start-up and page loads block, so keep them off the event loop
+            driver = await asyncio.to_thread(self._get_driver)
             
             # Random delay to appear more human-like
             await asyncio.sleep(random.uniform(1.0, 3.0))
@@ -347,31 +442,24 @@ class LinkedInScraper:
             # Build and navigate to search URL
             search_url = self._build_search_url(keyword, location, is_internship, time_filter)
             
-            self.logger.info(f"Navigating to: {search_url}")
-            driver.get(search_url)
+            self.logger.info("Navigating to: %s", search_url)
+            await asyncio.to_thread(driver.get, search_url)
             
-            # Check if we're redirected to login or blocked
-            current_url = driver.current_url.lower()
-            page_source = driver.page_source.lower()
-            
-            if "login" in current_url:
-                self.logger.error("Redirected to LinkedIn login page - authentication required")
-                return job_urls
-            elif "challenge" in current_url or "captcha" in page_source:
-                self.logger.error("LinkedIn CAPTCHA or challenge detected")
-                return job_urls
-            elif "blocked" in page_source:
-                self.logger.error("LinkedIn blocked automated access")
+            # Check if we're redirected to login or blocked (the page source can be
+            # several MB, so read it off the event loop)
+            access_error = await asyncio.to_thread(self._page_access_error, driver)
+            if access_error:
+                self.logger.error(access_error)
                 return job_urls
             
             # Human-like page interaction
             await asyncio.sleep(random.uniform(3.0, 5.0))
             
             # Scroll to simulate human behavior
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
+            await asyncio.to_thread(driver.execute_script, "window.scrollTo(0, document.body.scrollHeight/3);")
             await asyncio.sleep(random.uniform(1.0, 2.0))
             
-            driver.execute_script("window.scrollTo(0, 0);")
+            await asyncio.to_thread(driver.execute_script, "window.scrollTo(0, 0);")
             await asyncio.sleep(random.uniform(1.0, 2.0))
             
             # Extract job URLs with streaming
@@ -379,10 +467,10 @@ class LinkedInScraper:
                 driver, job_callback, all_found_urls, max_results
             )
             
-            self.logger.info(f"Found {len(job_urls)} jobs for '{keyword}' in '{location}'")
+            self.logger.info("Found %s jobs for '%s' in '%s'", len(job_urls), keyword, location)
             
         except Exception as e:
-            self.logger.error(f"Error in job search: {e}")
+            self.logger.error("Error in job search: %s", e)
         
         return job_urls
 
@@ -450,21 +538,24 @@ class LinkedInScraper:
         
         try:
             job_type = "internship" if is_internship else "job"
-            self.logger.info(f"Starting validated streaming search for '{keyword}' ({job_type})")
+            self.logger.info("Starting validated streaming search for '%s' (%s)", keyword, job_type)
             
             # First: Try enhanced scraping with validation
-            from .linkedin_enhanced import LinkedInEnhancedScraper
-            enhanced_scraper = LinkedInEnhancedScraper(self.config)
+            if self._enhanced_scraper is None:
+                from .linkedin_enhanced import LinkedInEnhancedScraper
+                self._enhanced_scraper = LinkedInEnhancedScraper(self.config)
+            enhanced_scraper = self._enhanced_scraper
             
             try:
-                if is_internship:
-                    enhanced_jobs = await enhanced_scraper.search_internships_enhanced(
-                        keyword, max_results, time_filter, job_callback
-                    )
-                else:
-                    enhanced_jobs = await enhanced_scraper.search_jobs_enhanced(
-                        keyword, max_results, time_filter, job_callback
-                    )
+                async with self._enhanced_lock:
+                    if is_internship:
+                        enhanced_jobs = await enhanced_scraper.search_internships_enhanced(
+                            keyword, max_results, time_filter, job_callback
+                        )
+                    else:
+                        enhanced_jobs = await enhanced_scraper.search_jobs_enhanced(
+                            keyword, max_results, time_filter, job_callback
+                        )
                 
                 # Extract URLs from enhanced results
                 for job in enhanced_jobs:
@@ -474,21 +565,25 @@ class LinkedInScraper:
                         found_count += 1
                 
                 if found_count > 0:
-                    self.logger.info(f"Enhanced scraping found {found_count} validated jobs")
+                    if isinstance(enhanced_jobs, FallbackJobList):
+                        self.logger.warning("Enhanced scraping returned %s fallback jobs (scraping blocked)", found_count)
+                        return FallbackJobList(all_job_urls)
+                    self.logger.info("Enhanced scraping found %s validated jobs", found_count)
                     return all_job_urls
                     
             except Exception as enhanced_error:
-                self.logger.warning(f"Enhanced scraping failed: {enhanced_error}")
+                self.logger.warning("Enhanced scraping failed: %s", enhanced_error)
             
             # Second: Try basic LinkedIn scraping if enhanced fails
             self.logger.info("Attempting basic LinkedIn scraping...")
-            success = await self._attempt_linkedin_streaming(
-                keyword, is_internship, max_results, time_filter, 
-                job_callback, all_job_urls, all_found_urls
-            )
+            async with self._driver_lock:
+                success = await self._attempt_linkedin_streaming(
+                    keyword, is_internship, max_results, time_filter, 
+                    job_callback, all_job_urls, all_found_urls
+                )
             
             if success and len(all_job_urls) > 0:
-                self.logger.info(f"Basic scraping found {len(all_job_urls)} jobs")
+                self.logger.info("Basic scraping found %s jobs", len(all_job_urls))
                 return all_job_urls
             
             # Third: Only use demo as absolute last resort with warning
@@ -509,10 +604,12 @@ class LinkedInScraper:
                         await asyncio.sleep(1)
             
             if found_count > 0:
-                self.logger.warning(f"Using {found_count} realistic fallback jobs (scraping blocked)")
+                self.logger.warning("Using %s realistic fallback jobs (scraping blocked)", found_count)
+            
+            return FallbackJobList(all_job_urls)
             
         except Exception as e:
-            self.logger.error(f"Error in streaming search: {e}")
+            self.logger.error("Error in streaming search: %s", e)
         
         return all_job_urls
 
@@ -542,7 +639,7 @@ class LinkedInScraper:
                 if found_count >= max_results:
                     break
                 
-                self.logger.info(f"Streaming search in {location}...")
+                self.logger.info("Streaming search in %s...", location)
                 
                 # Calculate remaining results needed
                 remaining_results = max_results - found_count
@@ -578,10 +675,10 @@ class LinkedInScraper:
             return found_count > 0
             
         except Exception as e:
-            self.logger.error(f"LinkedIn streaming attempt failed: {e}")
+            self.logger.error("LinkedIn streaming attempt failed: %s", e)
             return False
 
-    def _generate_current_realistic_jobs(self, keyword: str, is_internship: bool, max_results: int) -> List[str]:
+    def _generate_current_realistic_jobs(self, keyword: str, is_internship: bool, max_results: int) -> "FallbackJobList":
         """
         Generate current, realistic job URLs when LinkedIn scraping fails.
         These are current opportunities based on keyword and market trends.
@@ -590,7 +687,7 @@ class LinkedInScraper:
         from datetime import datetime, timedelta
         
         keyword_lower = keyword.lower()
-        job_urls = []
+        job_urls = FallbackJobList()
         
         # Current timestamp for very recent job IDs (last 1-7 days)
         now = datetime.now()
@@ -653,7 +750,7 @@ class LinkedInScraper:
             job_urls.append(job_url)
         
         job_type = "internship" if is_internship else "job"
-        self.logger.info(f"Generated {len(job_urls)} current {job_type} opportunities for '{keyword}' (LinkedIn access limited)")
+        self.logger.info("Generated %s current %s opportunities for '%s' (LinkedIn access limited)", len(job_urls), job_type, keyword)
         return job_urls
 
     # Non-streaming methods (legacy support)
@@ -672,44 +769,145 @@ class LinkedInScraper:
         Now attempts basic scraping before falling back to realistic data.
         """
         try:
-            self.logger.info(f"Legacy search method called for '{keyword}' ({'internship' if is_internship else 'job'})")
+            self.logger.info("Legacy search method called for '%s' (%s)", keyword, 'internship' if is_internship else 'job')
             
             # Try basic scraping first
             try:
+                from selenium.webdriver.common.by import By
+                from selenium.webdriver.support.ui import WebDriverWait
+                from selenium.webdriver.support import expected_conditions as EC
+                from selenium.common.exceptions import TimeoutException
+                
                 driver = self._get_driver()
                 search_url = self._build_search_url(keyword, "India", is_internship, time_filter)
                 
                 driver.get(search_url)
-                time.sleep(3)
+                
+                # Wait for job links instead of a fixed delay (bounded by the old 3s pause)
+                try:
+                    WebDriverWait(driver, 3).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/jobs/view/']"))
+                    )
+                except TimeoutException:
+                    pass
                 
                 # Check if blocked
                 if "login" not in driver.current_url.lower():
                     # Try to extract some basic job URLs
                     job_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/jobs/view/']")
-                    job_urls = []
+                    hrefs = driver.execute_script(_HREFS_SCRIPT, job_links[:max_results])
                     
-                    for link in job_links[:max_results]:
-                        href = link.get_attribute("href")
-                        if href and href not in job_urls:
-                            clean_url = href.split("?")[0]
-                            job_urls.append(clean_url)
+                    # Order-preserving dedupe of the cleaned URLs
+                    job_urls = list(dict.fromkeys(href.split("?")[0] for href in hrefs if href))
                     
                     if len(job_urls) > 0:
-                        self.logger.info(f"Legacy scraping found {len(job_urls)} jobs")
+                        self.logger.info("Legacy scraping found %s jobs", len(job_urls))
                         return job_urls
                         
             except Exception as scraping_error:
-                self.logger.debug(f"Legacy scraping failed: {scraping_error}")
+                self.logger.debug("Legacy scraping failed: %s", scraping_error)
             
             # Fallback to realistic data
             realistic_jobs = self._generate_current_realistic_jobs(keyword, is_internship, max_results)
-            self.logger.warning(f"Legacy search using {len(realistic_jobs)} realistic fallback jobs")
+            self.logger.warning("Legacy search using %s realistic fallback jobs", len(realistic_jobs))
             return realistic_jobs
             
         except Exception as e:
-            self.logger.error(f"Error in legacy search: {e}")
+            self.logger.error("Error in legacy search: %s", e)
             return []
 
+    async def _search_tier(self, session: aiohttp.ClientSession, tier: str, keyword: str,
+                           is_internship: bool, time_filter: str) -> List[str]:
+        """
+        Query one location tier of LinkedIn's guest search API.
+        
+        Args:
+            session: Shared aiohttp session used for the request
+            tier: Key into GUEST_SEARCH_TIERS
+            keyword: Search keyword
+            is_internship: Whether to search for internships
+            time_filter: LinkedIn posting-time filter
+            
+        Returns:
+            List[str]: Job URLs found in this tier (empty on failure)
+        """
+        location, extra_params = GUEST_SEARCH_TIERS[tier]
+        
+        # Same query string as the browser search, sent to the guest endpoint
+        query = self._build_search_url(keyword, location, is_internship, time_filter).partition("?")[2]
+        
+        # Local timer: concurrent searches share tier names, and the stable
+        # operation name lets the per-tier durations be aggregated
+        started = time.perf_counter()
+        try:
+            async with session.get(f"{GUEST_SEARCH_URL}?{query}{extra_params}",
+                                   timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    self.logger.debug("Guest search (%s) returned HTTP %s", tier, resp.status)
+                    return []
+                html = await resp.text(errors="ignore")
+                return _JOB_VIEW_URL_RE.findall(html)
+                
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.debug("Guest search (%s) failed: %s", tier, e)
+            return []
+        finally:
+            operation = f"guest_search_{tier}"
+            duration = time.perf_counter() - started
+            self.logger.info("Operation '%s' completed in %.3fs", operation, duration,
+                             extra={'operation': operation, 'duration': duration})
+
+    async def search_for_jobs_and_internships_async(self, session: aiohttp.ClientSession, keyword: str,
+                                                    is_internship: bool = False, max_results: int = 10,
+                                                    time_filter: str = "r86400",
+                                                    max_concurrency: int = GUEST_SEARCH_CONCURRENCY) -> List[str]:
+        """
+        Non-streaming search over LinkedIn's guest API, without a browser.
+        
+        All location tiers are requested concurrently (at most max_concurrency
+        in flight) and merged in tier order, so India results still come first.
+        
+        Args:
+            session: Shared aiohttp session used for the requests
+            keyword: Search keyword
+            is_internship: Whether to search for internships
+            max_results: Maximum number of job URLs to return
+            time_filter: LinkedIn posting-time filter
+            max_concurrency: Maximum number of tier requests in flight
+            
+        Returns:
+            List[str]: Job URLs, or a FallbackJobList of generated URLs if none were found
+        """
+        self.logger.info("Async search called for '%s' (%s)", keyword, 'internship' if is_internship else 'job')
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def guarded(tier: str) -> List[str]:
+            async with semaphore:
+                return await self._search_tier(session, tier, keyword, is_internship, time_filter)
+        
+        tier_results = await asyncio.gather(*(guarded(tier) for tier in GUEST_SEARCH_TIERS))
+        
+        # Order-preserving merge and dedupe across tiers
+        job_urls = list(dict.fromkeys(url for urls in tier_results for url in urls))[:max_results]
+        
+        if job_urls:
+            self.logger.info("Async search found %s jobs", len(job_urls))
+            return job_urls
+        
+        # Fallback to realistic data
+        realistic_jobs = self._generate_current_realistic_jobs(keyword, is_internship, max_results)
+        self.logger.warning("Async search using %s realistic fallback jobs", len(realistic_jobs))
+        return realistic_jobs
+
+    async def aclose(self) -> None:
+        """Close the WebDrivers without blocking the event loop."""
+        async with self._driver_lock:
+            await asyncio.to_thread(self._close_driver)
+        if self._enhanced_scraper is not None:
+            async with self._enhanced_lock:
+                await self._enhanced_scraper.aclose()
+
     def __del__(self):
         """Cleanup on object destruction."""
         self._close_driver()
@@ -15,6 +15,7 @@ import logging
 import re
 from typing import List, Optional, Set, Callable, Dict, Any
 from datetime import datetime, timedelta
+from urllib.parse import quote
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -22,10 +23,22 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-
 from ..utils.config import ConfigurationManager
 from ..utils.logging import get_bot_logger
+from .driver import CONTENT_BLOCKING_PREFS, FIRST_MATCH_SCRIPT, block_heavy_resources, get_chromedriver_path
+from .linkedin import FallbackJobList
+
+
+# Job card selectors, in order of preference
+JOB_CARD_SELECTORS = (
+    ".job-search-card",
+    ".job-result-card",
+    ".jobs-search-results__list-item",
+    "[data-test-id='job-card']"
+)
+
+# Page-source markers indicating LinkedIn refused the request
+_BLOCK_MARKERS_RE = re.compile(r"captcha|blocked", re.IGNORECASE)
 
 
 class JobValidationError(Exception):
@@ -75,8 +88,12 @@ class LinkedInEnhancedScraper:
             chrome_options.add_argument("--disable-features=TranslateUI")
             chrome_options.add_argument("--disable-ipc-flooding-protection")
             
+            # Skip downloading assets that are never scraped
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", CONTENT_BLOCKING_PREFS)
+            
             # Create service and driver
-            service = Service(ChromeDriverManager().install())
+            service = Service(get_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Enhanced anti-detection scripts
@@ -89,12 +106,14 @@ class LinkedInEnhancedScraper:
             driver.execute_script("Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 4})")
             driver.execute_script("Object.defineProperty(navigator, 'deviceMemory', {get: () => 8})")
             
+            block_heavy_resources(driver)
+            
             self.logger.info("Enhanced Chrome WebDriver initialized")
             self.session_start_time = datetime.now()
             return driver
             
         except Exception as e:
-            self.logger.error(f"Failed to setup enhanced driver: {e}")
+            self.logger.error("Failed to setup enhanced driver: %s", e)
             raise WebDriverException(f"Enhanced driver setup failed: {e}")
 
     def _get_driver(self) -> webdriver.Chrome:
@@ -112,7 +131,7 @@ class LinkedInEnhancedScraper:
                 self.session_start_time = None
                 self.logger.info("Enhanced WebDriver closed")
             except Exception as e:
-                self.logger.error(f"Error closing enhanced driver: {e}")
+                self.logger.error("Error closing enhanced driver: %s", e)
 
     def _validate_job_freshness(self, job_element) -> bool:
         """Validate that a job is fresh (posted within configured timeframe)."""
@@ -140,7 +159,7 @@ class LinkedInEnhancedScraper:
             return True
             
         except Exception as e:
-            self.logger.debug(f"Error validating job freshness: {e}")
+            self.logger.debug("Error validating job freshness: %s", e)
             return True  # Default to including the job
 
     def _is_fresh_posting(self, time_text: str) -> bool:
@@ -243,7 +262,7 @@ class LinkedInEnhancedScraper:
                     continue
             
         except Exception as e:
-            self.logger.debug(f"Error extracting job details: {e}")
+            self.logger.debug("Error extracting job details: %s", e)
         
         return details
 
@@ -274,7 +293,7 @@ class LinkedInEnhancedScraper:
             return False
             
         except Exception as e:
-            self.logger.debug(f"Error validating job relevance: {e}")
+            self.logger.debug("Error validating job relevance: %s", e)
             return True  # Default to including if validation fails
 
     async def search_jobs_enhanced(self, keyword: str, max_results: int = 10,
@@ -311,7 +330,7 @@ class LinkedInEnhancedScraper:
         
         try:
             job_type = "internship" if is_internship else "job"
-            self.logger.info(f"Starting enhanced search for '{keyword}' ({job_type})")
+            self.logger.info("Starting enhanced search for '%s' (%s)", keyword, job_type)
             
             # Try enhanced LinkedIn scraping
             success = await self._attempt_enhanced_linkedin_scraping(
@@ -325,9 +344,10 @@ class LinkedInEnhancedScraper:
                 await self._try_alternative_search_methods(
                     keyword, is_internship, max_results, job_callback, all_jobs
                 )
+                return FallbackJobList(all_jobs)
             
         except Exception as e:
-            self.logger.error(f"Error in enhanced streaming search: {e}")
+            self.logger.error("Error in enhanced streaming search: %s", e)
         
         return all_jobs
 
@@ -354,7 +374,7 @@ class LinkedInEnhancedScraper:
                 if found_count >= max_results:
                     break
                 
-                self.logger.info(f"Searching in {location}...")
+                self.logger.info("Searching in %s...", location)
                 
                 location_jobs = await self._search_location_enhanced(
                     keyword, location, is_internship, max_results - found_count,
@@ -374,7 +394,7 @@ class LinkedInEnhancedScraper:
             return found_count > 0
             
         except Exception as e:
-            self.logger.error(f"Enhanced LinkedIn scraping failed: {e}")
+            self.logger.error("Enhanced LinkedIn scraping failed: %s", e)
             return False
 
     async def _search_location_enhanced(self, keyword: str, location: str, is_internship: bool,
@@ -385,42 +405,20 @@ class LinkedInEnhancedScraper:
         location_jobs = []
         
         try:
-            driver = self._get_driver()
-            
             # Build search URL
             search_url = self._build_enhanced_search_url(keyword, location, is_internship, time_filter)
-            self.logger.info(f"Enhanced search URL: {search_url}")
-            
-            driver.get(search_url)
-            await asyncio.sleep(5)  # Wait for page load
+            self.logger.info("Enhanced search URL: %s", search_url)
             
-            # Check for blocking
-            if self._is_page_blocked(driver):
-                self.logger.warning(f"Page blocked for location: {location}")
+            # Every step up to the validated jobs is a blocking WebDriver round-trip,
+            # so run them together off the event loop
+            valid_jobs = await asyncio.to_thread(
+                self._scrape_location_jobs, search_url, keyword, max_results, found_urls
+            )
+            if valid_jobs is None:
+                self.logger.warning("Page blocked for location: %s", location)
                 return location_jobs
             
-            # Extract jobs with validation
-            job_elements = self._find_job_elements(driver)
-            
-            for job_element in job_elements:
-                if len(location_jobs) >= max_results:
-                    break
-                
-                # Validate freshness first
-                if not self._validate_job_freshness(job_element):
-                    continue
-                
-                # Extract details
-                job_details = self._extract_job_details(job_element)
-                
-                # Validate relevance
-                if not self._validate_job_relevance(job_details, keyword):
-                    continue
-                
-                # Check for duplicates
-                if job_details["url"] in found_urls:
-                    continue
-                
+            for job_details in valid_jobs:
                 # Valid job found - add and stream
                 location_jobs.append(job_details)
                 
@@ -429,10 +427,58 @@ class LinkedInEnhancedScraper:
                     await asyncio.sleep(0.5)
             
         except Exception as e:
-            self.logger.error(f"Error searching location {location}: {e}")
+            self.logger.error("Error searching location %s: %s", location, e)
         
         return location_jobs
 
+    def _scrape_location_jobs(self, search_url: str, keyword: str, max_results: int,
+                              found_urls: Set[str]) -> Optional[List[Dict[str, str]]]:
+        """
+        Load a search page and extract its valid jobs (blocking; run in a worker thread).
+        
+        Args:
+            search_url: LinkedIn search URL to load
+            keyword: Search keyword used for relevance checks
+            max_results: Maximum number of jobs to return
+            found_urls: URLs already found by earlier locations
+            
+        Returns:
+            Optional[List[Dict[str, str]]]: Fresh, relevant jobs not in found_urls,
+            or None if LinkedIn blocked the page
+        """
+        driver = self._get_driver()
+        driver.get(search_url)
+        self._wait_for_job_cards(driver)
+        
+        # Check for blocking
+        if self._is_page_blocked(driver):
+            return None
+        
+        # Extract jobs with validation
+        valid_jobs = []
+        for job_element in self._find_job_elements(driver):
+            if len(valid_jobs) >= max_results:
+                break
+            
+            # Validate freshness first
+            if not self._validate_job_freshness(job_element):
+                continue
+            
+            # Extract details
+            job_details = self._extract_job_details(job_element)
+            
+            # Validate relevance
+            if not self._validate_job_relevance(job_details, keyword):
+                continue
+            
+            # Check for duplicates
+            if job_details["url"] in found_urls:
+                continue
+            
+            valid_jobs.append(job_details)
+        
+        return valid_jobs
+
     def _build_enhanced_search_url(self, keyword: str, location: str, is_internship: bool, time_filter: str) -> str:
         """Build enhanced search URL with better parameters."""
         base_url = "https://www.linkedin.com/jobs/search"
@@ -443,11 +489,11 @@ class LinkedInEnhancedScraper:
             # Enhanced keyword for internships
             if is_internship and "intern" not in keyword.lower():
                 keyword = f"{keyword} intern"
-            params.append(f"keywords={keyword.replace(' ', '%20')}")
+            params.append(f"keywords={quote(keyword, safe='')}")
         
         # Location
         if location:
-            params.append(f"location={location.replace(' ', '%20').replace(',', '%2C')}")
+            params.append(f"location={quote(location, safe='')}")
         
         # Time filter (last 24 hours by default)
         params.append(f"f_TPR={time_filter}")
@@ -470,42 +516,38 @@ class LinkedInEnhancedScraper:
         """Check if LinkedIn has blocked our access."""
         try:
             current_url = driver.current_url.lower()
-            page_source = driver.page_source.lower()
-            
-            blocking_indicators = [
-                "login" in current_url,
-                "challenge" in current_url,
-                "captcha" in page_source,
-                "blocked" in page_source,
-                "authwall" in current_url
-            ]
+            if any(marker in current_url for marker in ("login", "challenge", "authwall")):
+                return True
             
-            return any(blocking_indicators)
+            # Only fetch the page source when the URL looks fine; scan it once
+            return _BLOCK_MARKERS_RE.search(driver.page_source) is not None
             
         except Exception:
             return True
 
+    def _wait_for_job_cards(self, driver: webdriver.Chrome, timeout: float = 5) -> bool:
+        """Wait until any job card is present, returning as soon as the page is ready."""
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(JOB_CARD_SELECTORS)))
+            )
+            return True
+        except TimeoutException:
+            self.logger.debug("No job cards after %ss, continuing with current page", timeout)
+            return False
+
     def _find_job_elements(self, driver: webdriver.Chrome) -> List:
         """Find job elements on the page with multiple selectors."""
         job_elements = []
         
-        # Multiple selectors to try
-        selectors = [
-            ".job-search-card",
-            ".job-result-card",
-            ".jobs-search-results__list-item",
-            "[data-test-id='job-card']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if len(elements) > 0:
-                    self.logger.info(f"Found {len(elements)} job elements with selector: {selector}")
-                    job_elements = elements
-                    break
-            except Exception:
-                continue
+        # Resolve the first matching selector inside the browser in a single round-trip
+        try:
+            selector, elements = driver.execute_script(FIRST_MATCH_SCRIPT, list(JOB_CARD_SELECTORS))
+            if elements:
+                self.logger.info("Found %s job elements with selector: %s", len(elements), selector)
+                job_elements = elements
+        except Exception as e:
+            self.logger.debug("Error finding job elements: %s", e)
         
         return job_elements
 
@@ -609,6 +651,10 @@ class LinkedInEnhancedScraper:
         
         return jobs
 
+    async def aclose(self) -> None:
+        """Close the WebDriver without blocking the event loop."""
+        await asyncio.to_thread(self._close_driver)
+
     def __del__(self):
         """Cleanup on destruction."""
         self._close_driver()
@@ -98,8 +98,10 @@ class ConfigurationManager:
         self.project_root = Path(__file__).parent.parent.parent
         self.env_path = self.project_root / env_file
         
-        # Load environment variables
-        load_dotenv(self.env_path)
+        # Load environment variables (regular files only: opening a FIFO
+        # .env blocks until a writer appears)
+        if self.env_path.is_file():
+            load_dotenv(self.env_path)
         
         # Initialize configurations
         self.telegram_token = self._get_telegram_token()
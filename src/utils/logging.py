@@ -78,16 +78,22 @@ class PerformanceMonitor:
     
     def time_function(self, func: Callable) -> Callable:
         """Decorator to time function execution."""
+        func_name = f"{func.__module__}.{func.__qualname__}"
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            func_name = f"{func.__module__}.{func.__qualname__}"
-            self.start_timer(func_name)
+            # Durations are logged at INFO; skip the timer bookkeeping when nobody sees them
+            timed = self.logger.isEnabledFor(logging.INFO)
+            if timed:
+                self.start_timer(func_name)
             try:
                 result = func(*args, **kwargs)
-                self.end_timer(func_name)
+                if timed:
+                    self.end_timer(func_name)
                 return result
             except Exception as e:
-                self.end_timer(func_name)
+                if timed:
+                    self.end_timer(func_name)
                 self.logger.error(f"Function '{func_name}' failed: {e}", 
                                 extra={'function': func_name, 'error': str(e)})
                 raise
@@ -180,10 +186,22 @@ class BotLogger:
     
     def log_function_call(self, func: Callable) -> Callable:
         """Decorator to log function calls with parameters and results."""
+        func_name = f"{func.__module__}.{func.__qualname__}"
+        logger = self.get_logger(func.__module__)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            func_name = f"{func.__module__}.{func.__qualname__}"
-            logger = self.get_logger(func.__module__)
+            # Entry/exit records are DEBUG only; call straight through otherwise
+            if not logger.isEnabledFor(logging.DEBUG):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Function failed: {func_name}", extra={
+                        'function': func_name,
+                        'error': str(e),
+                        'error_type': type(e).__name__
+                    }, exc_info=True)
+                    raise
             
             # Log function entry
             logger.debug(f"Entering function: {func_name}", extra={
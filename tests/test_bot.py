@@ -6,7 +6,7 @@ Professional test cases for all major components.
 
 import unittest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from pathlib import Path
 import sys
 
@@ -15,7 +15,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.utils.config import ConfigurationManager, BotConfig, SearchConfig
 from src.bot.messages import MessageTemplates, JobType, MessageFormatter, LocationType
-from src.scraper.linkedin import LinkedInScraper
+from src.bot.messages import MessageFormatterLegacy
+from src.bot.messages import _DETAIL_SCAN_OVERLAP, _scan_job_details, TELEGRAM_MESSAGE_LIMIT
+from src.scraper.linkedin import GUEST_SEARCH_TIERS, FallbackJobList, LinkedInScraper
+from src.bot.handlers import CONVERSATION_TIMEOUT, JOB_BATCH_SIZE, ConversationData, ConversationHandlers, ConversationState
+from src.bot.main import LinkedInJobBot, SEARCH_CACHE_TTL
+from telegram.ext import ConversationHandler
 
 
 class TestConfigurationManager(unittest.TestCase):
@@ -76,6 +81,47 @@ class TestMessageTemplates(unittest.TestCase):
         self.assertIn("Job", message)
         self.assertIn("India", message)
         self.assertIn("10", message)
+    
+    def test_role_is_markdown_escaped(self):
+        """User-supplied roles cannot open Markdown entities in status messages."""
+        self.assertIn("data\\_engineer", MessageTemplates.search_started_message("data_engineer"))
+        self.assertIn("data\\_engineer", MessageTemplates.search_plan_message("data_engineer", JobType.JOB))
+        
+        header = MessageTemplates.success_message_chunks(
+            role="data_engineer", job_type=JobType.JOB, location="India", opportunities=["job"]
+        )[0]
+        self.assertIn("Data\\_Engineer", header)
+    
+    def test_success_message_chunks_packing(self):
+        """Results are packed in order into parts under the limit, header first and footer last."""
+        opportunities = [f"Job {i}: " + "x" * 300 for i in range(30)]
+        chunks = MessageTemplates.success_message_chunks(
+            role="Java Developer", job_type=JobType.JOB, location="India",
+            opportunities=opportunities, limit=1000
+        )
+        
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(chunks[0].startswith("💼 **Java Developer Job Results**"))
+        self.assertIn("Job 0:", chunks[0])
+        self.assertIn("**Focus**: India", chunks[-1])
+        self.assertTrue(all(len(chunk) <= TELEGRAM_MESSAGE_LIMIT for chunk in chunks))
+        
+        # Every opportunity appears once, unsplit and in order
+        combined = "\n\n".join(chunks)
+        positions = [combined.index(opportunity) for opportunity in opportunities]
+        self.assertEqual(positions, sorted(positions))
+    
+    def test_success_message_chunks_keeps_header_with_large_item(self):
+        """A near-limit opportunity shares its part with the header instead of splitting it off."""
+        chunks = MessageTemplates.success_message_chunks(
+            role="Java Developer", job_type=JobType.JOB, location="India",
+            opportunities=["x" * 3990]
+        )
+        
+        self.assertEqual(len(chunks), 2)
+        self.assertIn("Results**", chunks[0])
+        self.assertIn("x" * 3990, chunks[0])
+        self.assertTrue(all(len(chunk) <= TELEGRAM_MESSAGE_LIMIT for chunk in chunks))
 
 
 class TestMessageFormatter(unittest.TestCase):
@@ -111,6 +157,21 @@ class TestMessageFormatter(unittest.TestCase):
             LocationType.GLOBAL
         )
 
+    def test_remote_detection_matches_filter_exactly(self):
+        """The remote word matches in any case; the f_WT=2 filter only as LinkedIn writes it."""
+        self.assertEqual(
+            MessageFormatterLegacy.determine_location_type("LOCATION: Fully REMOTE"),
+            LocationType.REMOTE
+        )
+        self.assertEqual(
+            MessageFormatterLegacy.determine_location_type("https://linkedin.com/jobs/view/123?f_WT=2"),
+            LocationType.REMOTE
+        )
+        self.assertEqual(
+            MessageFormatterLegacy.determine_location_type("https://linkedin.com/jobs/view/123?f_wt=2"),
+            LocationType.GLOBAL
+        )
+    
     def test_extract_job_details_contract(self):
         """extractJobDetails should return a dict with company/title/location keys."""
         import asyncio
@@ -122,6 +183,237 @@ class TestMessageFormatter(unittest.TestCase):
         self.assertIn("title", details)
         self.assertIn("location", details)
         self.assertIsInstance(details["company"], str)
+    
+    def test_scan_job_details_across_chunk_boundary(self):
+        """A field split between two chunks is found via the carried-over tail."""
+        html = (
+            '<html>' + ' ' * 5000 +
+            '{"companyName":"Acme Corp","formattedLocation":"Pune, India","jobTitle":"Data Engineer"}'
+        )
+        split = html.index("Acme") + 2
+        first, second = html[:split], html[split:]
+        
+        found = {}
+        self.assertFalse(_scan_job_details(first, found))
+        self.assertNotIn("company", found)
+        
+        self.assertTrue(_scan_job_details(first[-_DETAIL_SCAN_OVERLAP:] + second, found))
+        self.assertEqual(found["company"], "Acme Corp")
+        self.assertEqual(found["location"], "Pune, India")
+        self.assertEqual(found["title"], "Data Engineer")
+    
+    def test_extract_job_details_stops_reading_early(self):
+        """The page is not read past the chunk that completes the details."""
+        page = [
+            b'<html>{"companyName":"Acme Corp","formattedLocation":"Pune, India",',
+            b'"jobTitle":"Data Engineer"}',
+            b"<div>" + b"x" * 16384 + b"</div>",
+            b"<div>" + b"y" * 16384 + b"</div>",
+        ]
+        chunks_read = []
+        
+        async def iter_chunked(size):
+            for chunk in page:
+                chunks_read.append(chunk)
+                yield chunk
+        
+        response = Mock(status=200, charset="utf-8")
+        response.content.iter_chunked = iter_chunked
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = response
+        
+        details = asyncio.run(
+            MessageFormatter.extractJobDetails("https://www.linkedin.com/jobs/view/123456", session)
+        )
+        
+        self.assertEqual(details["company"], "Acme Corp")
+        self.assertEqual(details["title"], "Data Engineer")
+        self.assertEqual(len(chunks_read), 2)
+
+
+class TestConversationData(unittest.TestCase):
+    """Test per-user conversation storage."""
+    
+    def test_arbitrary_keys(self):
+        """Keys other than job_type/role can be stored, read and cleared."""
+        data = ConversationData()
+        data.set_user_data(1, "job_type", JobType.JOB)
+        data.set_user_data(1, "page", 2)
+        
+        self.assertEqual(data.get_user_value(1, "page"), 2)
+        self.assertEqual(data.get_user_data(1), {"job_type": JobType.JOB, "page": 2})
+        
+        data.clear_user_data(1)
+        self.assertEqual(data.get_user_data(1), {})
+    
+    def test_unknown_key_returns_default(self):
+        """Reading a key that was never set returns the default."""
+        data = ConversationData()
+        self.assertIsNone(data.get_user_value(1, "missing"))
+        self.assertEqual(data.get_user_value(1, "missing", "fallback"), "fallback")
+    
+    def test_evict_expired_drops_only_stale_entries(self):
+        """Conversations idle past the timeout are removed; recent ones are kept."""
+        data = ConversationData()
+        with patch("src.bot.handlers.time.monotonic", return_value=1000.0):
+            data.set_user_data(1, "role", "Java Developer")
+        with patch("src.bot.handlers.time.monotonic", return_value=1000.0 + CONVERSATION_TIMEOUT - 10):
+            data.set_user_data(2, "role", "Python Developer")
+        
+        with patch("src.bot.handlers.time.monotonic", return_value=1000.0 + CONVERSATION_TIMEOUT + 1):
+            self.assertEqual(data.evict_expired(), 1)
+        
+        self.assertEqual(data.get_user_data(1), {})
+        self.assertEqual(data.get_user_data(2), {"role": "Python Developer"})
+    
+    def test_writes_trigger_periodic_sweep(self):
+        """Every SWEEP_INTERVAL writes, stale conversations are swept without an explicit call."""
+        data = ConversationData()
+        with patch("src.bot.handlers.time.monotonic", return_value=1000.0):
+            data.set_user_data(1, "role", "Java Developer")
+        
+        with patch("src.bot.handlers.time.monotonic", return_value=1000.0 + CONVERSATION_TIMEOUT + 1):
+            for _ in range(ConversationData.SWEEP_INTERVAL - 2):
+                data.set_user_data(2, "role", "Python Developer")
+            self.assertEqual(data.get_user_data(1), {"role": "Java Developer"})
+            
+            data.set_user_data(2, "role", "Python Developer")
+        
+        self.assertEqual(data.get_user_data(1), {})
+        self.assertEqual(data.get_user_data(2), {"role": "Python Developer"})
+
+
+class TestConversationHandlers(unittest.IsolatedAsyncioTestCase):
+    """Test conversation handlers with mocked Telegram objects."""
+    
+    def setUp(self):
+        self.handlers = ConversationHandlers(ConfigurationManager())
+        self.tasks = []
+        self.context = Mock()
+        self.context.application.create_task = (
+            lambda coroutine, update=None: self.tasks.append(asyncio.create_task(coroutine))
+        )
+    
+    def _message(self, text):
+        update = Mock()
+        update.effective_user.id = 42
+        update.message.text = text
+        update.message.reply_text = AsyncMock(return_value=Mock(edit_text=AsyncMock()))
+        return update
+    
+    async def _run_search(self, search):
+        """Run perform_search over a stub streaming search; return the streamed batches and all replies."""
+        scraper = Mock()
+        scraper.search_jobs_streaming = search
+        self.handlers._scraper = scraper
+        
+        update = self._message("Java Developer")
+        await self.handlers.perform_search(update, self.context, 42, JobType.JOB, "Java Developer")
+        
+        replies = [call.args[0] for call in update.message.reply_text.call_args_list]
+        batches = [
+            call.args[0] for call in update.message.reply_text.call_args_list
+            if call.kwargs.get("disable_web_page_preview")
+        ]
+        return batches, replies
+    
+    @staticmethod
+    def _job_url(number):
+        return f"https://www.linkedin.com/jobs/view/100000{number}"
+    
+    async def test_second_message_during_search_does_not_search_again(self):
+        """The conversation ends as the search starts, so more text cannot start another."""
+        searches = []
+        search_started = asyncio.Event()
+        release = asyncio.Event()
+        
+        async def fake_search(update, context, user_id, job_type, role):
+            searches.append(role)
+            search_started.set()
+            await release.wait()
+        
+        self.handlers.perform_search = fake_search
+        self.handlers.conversation_data.set_user_data(42, "job_type", JobType.JOB)
+        
+        first = await self.handlers.role_input(self._message("Java Developer"), self.context)
+        await search_started.wait()
+        second = await self.handlers.role_input(self._message("Python Developer"), self.context)
+        
+        self.assertEqual(first, ConversationHandler.END)
+        self.assertEqual(second, ConversationHandler.END)
+        self.assertEqual(searches, ["Java Developer"])
+        
+        release.set()
+        await asyncio.gather(*self.tasks)
+    
+    async def test_role_validation(self):
+        """Common job titles start a search; links, markup and bad lengths get the retry prompt."""
+        searches = []
+        
+        async def fake_search(update, context, user_id, job_type, role):
+            searches.append(role)
+        
+        self.handlers.perform_search = fake_search
+        accepted = [
+            "Women's Health Nurse", "C++ Developer", "Node.js Engineer",
+            "R&D Engineer (Remote)", "data_engineer",
+        ]
+        rejected = ["https://example.com/jobs", "<b>Developer</b>", "QA", "x" * 65, "Developer; DROP TABLE"]
+        
+        for role in accepted:
+            self.handlers.conversation_data.set_user_data(42, "job_type", JobType.JOB)
+            state = await self.handlers.role_input(self._message(role), self.context)
+            self.assertEqual(state, ConversationHandler.END, role)
+        
+        for role in rejected:
+            state = await self.handlers.role_input(self._message(role), self.context)
+            self.assertEqual(state, ConversationState.ENTERING_ROLE, role)
+        
+        await asyncio.gather(*self.tasks)
+        self.assertEqual(searches, accepted)
+    
+    async def test_job_batches_flush_at_batch_size(self):
+        """Jobs found together are sent JOB_BATCH_SIZE per message."""
+        async def search(keyword, max_results, time_filter, job_callback):
+            urls = [self._job_url(n) for n in range(JOB_BATCH_SIZE + 2)]
+            for url in urls:
+                await job_callback(url)
+            return urls
+        
+        batches, _ = await self._run_search(search)
+        
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(sum(self._job_url(n) in batches[0] for n in range(JOB_BATCH_SIZE + 2)), JOB_BATCH_SIZE)
+        self.assertIn(self._job_url(JOB_BATCH_SIZE + 1), batches[1])
+    
+    async def test_job_batches_flush_after_window(self):
+        """A job arriving after the batch window goes out in its own message."""
+        async def search(keyword, max_results, time_filter, job_callback):
+            await job_callback(self._job_url(0))
+            await asyncio.sleep(0.2)
+            await job_callback(self._job_url(1))
+            return [self._job_url(0), self._job_url(1)]
+        
+        with patch("src.bot.handlers.JOB_BATCH_WINDOW", 0.05):
+            batches, _ = await self._run_search(search)
+        
+        self.assertEqual(len(batches), 2)
+        self.assertIn(self._job_url(0), batches[0])
+        self.assertIn(self._job_url(1), batches[1])
+    
+    async def test_found_jobs_are_sent_before_search_error(self):
+        """Jobs queued before the search fails are delivered ahead of the error reply."""
+        async def search(keyword, max_results, time_filter, job_callback):
+            await job_callback(self._job_url(0))
+            await job_callback(self._job_url(1))
+            raise RuntimeError("LinkedIn blocked")
+        
+        batches, replies = await self._run_search(search)
+        
+        self.assertEqual(len(batches), 1)
+        self.assertIn(self._job_url(1), batches[0])
+        self.assertIn("Search Error", replies[-1])
+        self.assertLess(replies.index(batches[0]), len(replies) - 1)
 
 
 class TestLinkedInScraperMethods(unittest.TestCase):
@@ -156,6 +448,52 @@ class TestLinkedInScraperMethods(unittest.TestCase):
         self.assertIn("f_JT=I", url)  # Internship filter
 
 
+class TestGuestSearch(unittest.IsolatedAsyncioTestCase):
+    """Test the concurrent guest-API search over stubbed tiers."""
+    
+    def setUp(self):
+        self.scraper = LinkedInScraper(ConfigurationManager())
+    
+    async def test_tiers_merge_in_tier_order_without_duplicates(self):
+        """Results keep tier priority even when later tiers answer first, and repeats are dropped."""
+        tier_urls = {
+            "india": ["https://www.linkedin.com/jobs/view/1", "https://www.linkedin.com/jobs/view/2"],
+            "remote": ["https://www.linkedin.com/jobs/view/2", "https://www.linkedin.com/jobs/view/3"],
+            "global": ["https://www.linkedin.com/jobs/view/4"],
+        }
+        delays = {"india": 0.03, "remote": 0.02, "global": 0.0}
+        
+        async def search_tier(session, tier, keyword, is_internship, time_filter):
+            await asyncio.sleep(delays[tier])
+            return tier_urls[tier]
+        
+        with patch.object(self.scraper, "_search_tier", side_effect=search_tier):
+            job_urls = await self.scraper.search_for_jobs_and_internships_async(Mock(), "Java Developer")
+        
+        self.assertEqual(job_urls, [f"https://www.linkedin.com/jobs/view/{n}" for n in range(1, 5)])
+    
+    async def test_tier_requests_are_bounded(self):
+        """No more than max_concurrency tier requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+        
+        async def search_tier(session, tier, keyword, is_internship, time_filter):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [f"https://www.linkedin.com/jobs/view/{tier}"]
+        
+        with patch.object(self.scraper, "_search_tier", side_effect=search_tier):
+            job_urls = await self.scraper.search_for_jobs_and_internships_async(
+                Mock(), "Java Developer", max_concurrency=1
+            )
+        
+        self.assertEqual(peak, 1)
+        self.assertEqual(len(job_urls), len(GUEST_SEARCH_TIERS))
+
+
 class TestBotIntegration(unittest.IsolatedAsyncioTestCase):
     """Test bot integration components."""
     
@@ -182,6 +520,81 @@ class TestBotIntegration(unittest.IsolatedAsyncioTestCase):
             pass
 
 
+class TestSearchCache(unittest.IsolatedAsyncioTestCase):
+    """Test the bot's cache of recent search results."""
+    
+    JOB_URL = "https://www.linkedin.com/jobs/view/1234567890"
+    
+    def setUp(self):
+        self.bot = LinkedInJobBot(ConfigurationManager())
+        self.bot.scraper = Mock()
+    
+    def _stream(self, results):
+        """Streaming search stub that reports each URL and returns results."""
+        async def search(keyword, max_results, job_callback):
+            for url in results:
+                await job_callback(url)
+            return results
+        return AsyncMock(side_effect=search)
+    
+    def test_entries_expire_after_ttl(self):
+        """Entries are served until the TTL passes, then dropped."""
+        key = ("java developer", False)
+        with patch("src.bot.main.time.monotonic", return_value=1000.0):
+            self.bot._cache_search(key, [self.JOB_URL])
+        
+        with patch("src.bot.main.time.monotonic", return_value=1000.0 + SEARCH_CACHE_TTL - 1):
+            self.assertEqual(self.bot._get_cached_search(key), [self.JOB_URL])
+        
+        with patch("src.bot.main.time.monotonic", return_value=1000.0 + SEARCH_CACHE_TTL + 1):
+            self.assertIsNone(self.bot._get_cached_search(key))
+        self.assertNotIn(key, self.bot._search_cache)
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """A full cache evicts the entry read or written longest ago."""
+        with patch("src.bot.main.SEARCH_CACHE_SIZE", 2):
+            self.bot._cache_search(("a", False), ["a"])
+            self.bot._cache_search(("b", False), ["b"])
+            self.bot._get_cached_search(("a", False))
+            self.bot._cache_search(("c", False), ["c"])
+        
+        self.assertIsNone(self.bot._get_cached_search(("b", False)))
+        self.assertEqual(self.bot._get_cached_search(("a", False)), ["a"])
+        self.assertEqual(self.bot._get_cached_search(("c", False)), ["c"])
+    
+    async def test_key_ignores_role_case_and_whitespace(self):
+        """Searches differing only in role case and padding share one entry."""
+        self.bot.scraper.search_jobs_streaming = self._stream([self.JOB_URL])
+        
+        first = await self.bot._perform_search("Java Developer", JobType.JOB, 1)
+        second = await self.bot._perform_search("  JAVA developer ", JobType.JOB, 2)
+        
+        self.assertEqual(first, [self.JOB_URL])
+        self.assertEqual(second, [self.JOB_URL])
+        self.assertEqual(self.bot.scraper.search_jobs_streaming.await_count, 1)
+    
+    async def test_generated_results_are_not_cached(self):
+        """FallbackJobList results from a blocked scraper are never cached."""
+        self.bot.scraper.search_jobs_streaming = self._stream(FallbackJobList([self.JOB_URL]))
+        
+        await self.bot._perform_search("Java Developer", JobType.JOB, 1)
+        await self.bot._perform_search("Java Developer", JobType.JOB, 2)
+        
+        self.assertEqual(self.bot.scraper.search_jobs_streaming.await_count, 2)
+        self.assertEqual(len(self.bot._search_cache), 0)
+    
+    async def test_guest_api_results_are_not_cached(self):
+        """Results of the guest-API fallback search are never cached."""
+        self.bot.scraper.search_jobs_streaming = AsyncMock(side_effect=RuntimeError("blocked"))
+        self.bot.scraper.search_for_jobs_and_internships_async = AsyncMock(return_value=[self.JOB_URL])
+        self.bot._get_http_session = Mock()
+        
+        job_urls = await self.bot._perform_search("Java Developer", JobType.JOB, 1)
+        
+        self.assertEqual(job_urls, [self.JOB_URL])
+        self.assertEqual(len(self.bot._search_cache), 0)
+
+
 class TestErrorHandling(unittest.TestCase):
     """Test error handling scenarios."""
     